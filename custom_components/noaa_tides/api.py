@@ -1,35 +1,118 @@
 """NOAA Tides API client."""
 from __future__ import annotations
 
+from array import array
+import asyncio
+from bisect import bisect_right
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 import logging
 import math
+from operator import itemgetter
+import time
 from typing import Any
 import xml.etree.ElementTree as ET
 
 import aiohttp
+import numpy as np
 
-from .const import NOAA_API_BASE, TIDE_TYPE_HIGH, TIDE_TYPE_LOW
+try:
+    # Home Assistant ships orjson; fall back to the stdlib decoder elsewhere
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .const import NOAA_API_BASE, NOAA_STATIONS_URL, TIDE_TYPE_HIGH, TIDE_TYPE_LOW
 
 _LOGGER = logging.getLogger(__name__)
 
+EARTH_RADIUS_MILES = 3956
+MAX_NEAREST_STATIONS = 10
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points in miles using haversine formula."""
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
+XML_CHUNK_SIZE = 64 * 1024
+PROBE_READ_BYTES = 4096
+# Station child elements read from the catalog XML
+_STATION_FIELDS = frozenset(("id", "name", "state", "lat", "lng"))
 
-    # Haversine formula
-    a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
+# ZIP code centroids never change, so successful lookups are kept for the process lifetime
+_ZIP_CACHE: dict[str, tuple[float, float]] = {}
+
+# The station catalog changes on the order of weeks, so reuse the parsed copy for a day
+STATIONS_CACHE_TTL_SECONDS = 24 * 60 * 60
+_STATIONS_CACHE: dict[str, Any] = {"ts": 0.0, "data": None}
 
-    # Earth radius in miles
-    radius = 3956
 
-    return c * radius
+def haversine_distance_vec(
+    user_lat: float,
+    user_lon: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    cos_lats: np.ndarray | None = None,
+) -> np.ndarray:
+    """Calculate distances in miles from one point to arrays of points using haversine formula.
+
+    cos_lats can carry the precomputed cosine of each latitude (in radians) so fixed
+    station positions skip that step on every search.
+    """
+    if cos_lats is None:
+        cos_lats = np.cos(np.radians(lats))
+
+    # Convert to radians
+    delta_lat = np.radians(lats - user_lat)
+    delta_lon = np.radians(lons - user_lon)
+
+    # Haversine formula
+    a = np.sin(delta_lat / 2) ** 2 + math.cos(math.radians(user_lat)) * cos_lats * np.sin(delta_lon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return c * EARTH_RADIUS_MILES
+
+
+def _parse_noaa_ts(value: str) -> datetime:
+    """Parse a NOAA "YYYY-MM-DD HH:MM" GMT timestamp.
+
+    The format is fixed, so slicing avoids the per-call format interpretation of strptime.
+    """
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        tzinfo=timezone.utc,
+    )
+
+
+def _parse_series(records: list[dict[str, str]]) -> tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]:
+    """Parse a NOAA time/value series in one vectorized pass.
+
+    Returns epoch-second times and heights as parallel float64 arrays, plus the
+    equivalent list of {"time", "height"} dicts for callers that walk records.
+    """
+    times = np.array([record["t"] for record in records], dtype="datetime64[m]").astype("datetime64[s]")
+    heights = np.array([record["v"] for record in records], dtype=np.float64)
+    series = [
+        {"time": pred_time.replace(tzinfo=timezone.utc), "height": pred_height}
+        for pred_time, pred_height in zip(times.tolist(), heights.tolist())
+    ]
+    return times.astype(np.int64).astype(np.float64), heights, series
+
+
+async def _iter_stations(response: aiohttp.ClientResponse) -> AsyncIterator[ET.Element]:
+    """Stream <Station> elements from a NOAA metadata XML response.
+
+    The body is fed to an incremental parser chunk by chunk, so the full document
+    is never held as a string or DOM. Each station is cleared once the caller is
+    done with it to keep memory flat while parsing.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    async for chunk in response.content.iter_chunked(XML_CHUNK_SIZE):
+        parser.feed(chunk)
+        for _event, elem in parser.read_events():
+            if elem.tag == "Station":
+                yield elem
+                elem.clear()
+    parser.close()
 
 
 class NOAATidesAPI:
@@ -39,10 +122,22 @@ class NOAATidesAPI:
         """Initialize the API client."""
         self.session = session
         self.station_id = station_id
+        # Parameters shared by every datagetter request for this station
+        self._base_params = {
+            "application": "homeassistant",
+            "datum": "MLLW",
+            "station": station_id,
+            "time_zone": "gmt",
+            "units": "metric",
+            "format": "json",
+        }
 
     @staticmethod
     async def geocode_zip(session: aiohttp.ClientSession, zip_code: str) -> tuple[float, float] | None:
         """Get lat/lon for a US zip code using free API."""
+        if zip_code in _ZIP_CACHE:
+            return _ZIP_CACHE[zip_code]
+
         try:
             # Use zippopotam.us - free, no API key required
             url = f"http://api.zippopotam.us/us/{zip_code}"
@@ -58,6 +153,7 @@ class NOAATidesAPI:
                     lat = float(data["places"][0]["latitude"])
                     lon = float(data["places"][0]["longitude"])
                     _LOGGER.info("Geocoded zip %s to lat=%f, lon=%f", zip_code, lat, lon)
+                    _ZIP_CACHE[zip_code] = (lat, lon)
                     return (lat, lon)
 
                 return None
@@ -78,86 +174,140 @@ class NOAATidesAPI:
 
             user_lat, user_lon = coords
 
-            # First, get all water level stations (stations with live data)
-            waterlevel_ids = set()
-            try:
-                wl_response = await session.get(
-                    "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.xml",
-                    params={"type": "waterlevels", "units": "metric"}
-                )
-                if wl_response.status == 200:
-                    wl_xml = await wl_response.text()
-                    wl_root = ET.fromstring(wl_xml)
-                    for wl_station in wl_root.findall(".//Station"):
-                        wl_id_elem = wl_station.find("id")
-                        if wl_id_elem is not None and wl_id_elem.text:
-                            waterlevel_ids.add(wl_id_elem.text)
-                    _LOGGER.info("Found %d water level stations", len(waterlevel_ids))
-            except Exception as err:
-                _LOGGER.warning("Could not fetch water level stations: %s", err)
+            catalog = await NOAATidesAPI.get_station_catalog(session)
+            if not catalog:
+                return []
 
-            # Fetch all tide prediction stations
-            url = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.xml"
-            params = {
-                "type": "tidepredictions",  # All stations with tide predictions
-                "units": "metric",
-            }
+            station_ids = catalog["ids"]
+            if not station_ids:
+                _LOGGER.info("Found 0 nearest stations to zip %s", zip_code)
+                return []
 
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    _LOGGER.error("Error fetching station list: %s", response.status)
-                    return []
-
-                xml_data = await response.text()
-                root = ET.fromstring(xml_data)
-
-                stations = []
-                for station in root.findall(".//Station"):
-                    # XML elements, not attributes
-                    id_elem = station.find("id")
-                    name_elem = station.find("name")
-                    state_elem = station.find("state")
-                    lat_elem = station.find("lat")
-                    lon_elem = station.find("lng")
-
-                    if (id_elem is not None and name_elem is not None and
-                        lat_elem is not None and lon_elem is not None):
-                        try:
-                            station_id = id_elem.text
-                            name = name_elem.text
-                            state = state_elem.text if state_elem is not None and state_elem.text else ""
-                            lat = float(lat_elem.text)
-                            lon = float(lon_elem.text)
-
-                            # Calculate distance
-                            distance = haversine_distance(user_lat, user_lon, lat, lon)
-
-                            # Check if station has live water level data
-                            has_waterlevel = station_id in waterlevel_ids
-
-                            stations.append({
-                                "id": station_id,
-                                "name": name,
-                                "state": state,
-                                "lat": lat,
-                                "lon": lon,
-                                "distance": distance,
-                                "has_waterlevel": has_waterlevel,
-                            })
-                        except (ValueError, AttributeError, TypeError) as err:
-                            continue
-
-                # Sort by distance and return top 10
-                stations.sort(key=lambda x: x["distance"])
-                nearest = stations[:10]
-
-                _LOGGER.info("Found %d nearest stations to zip %s", len(nearest), zip_code)
-                return nearest
+            # Calculate all distances in a single vectorized pass
+            count = len(station_ids)
+            lat_arr = catalog["lats"]
+            lon_arr = catalog["lons"]
+            distances = haversine_distance_vec(user_lat, user_lon, lat_arr, lon_arr, catalog["cos_lats"])
+
+            # Select the nearest stations without sorting the full list
+            if count > MAX_NEAREST_STATIONS:
+                nearest_idx = np.argpartition(distances, MAX_NEAREST_STATIONS)[:MAX_NEAREST_STATIONS]
+            else:
+                nearest_idx = np.arange(count)
+            nearest_idx = nearest_idx[np.argsort(distances[nearest_idx])]
+
+            nearest = []
+            for i in nearest_idx.tolist():
+                station_id = station_ids[i]
+                nearest.append({
+                    "id": station_id,
+                    "name": catalog["names"][i],
+                    "state": catalog["states"][i],
+                    "lat": float(lat_arr[i]),
+                    "lon": float(lon_arr[i]),
+                    "distance": float(distances[i]),
+                    # Check if station has live water level data
+                    "has_waterlevel": station_id in catalog["waterlevel_ids"],
+                })
+
+            _LOGGER.info("Found %d nearest stations to zip %s", len(nearest), zip_code)
+            return nearest
 
         except Exception as err:
             _LOGGER.error("Error searching stations: %s", err)
             return []
 
+    @staticmethod
+    async def get_station_catalog(session: aiohttp.ClientSession) -> dict[str, Any] | None:
+        """Get the parsed NOAA station catalog, reusing a cached copy while it is fresh.
+
+        Returns:
+            Dict with station ids, names, states, lat/lon arrays and the set of
+            water level station ids, or None if the catalog could not be fetched
+        """
+        if (
+            _STATIONS_CACHE["data"] is not None
+            and time.monotonic() - _STATIONS_CACHE["ts"] < STATIONS_CACHE_TTL_SECONDS
+        ):
+            return _STATIONS_CACHE["data"]
+
+        # First, get all water level stations (stations with live data)
+        waterlevel_ids: frozenset[str] = frozenset()
+        waterlevel_ok = False
+        try:
+            async with session.get(
+                NOAA_STATIONS_URL,
+                params={"type": "waterlevels", "units": "metric"},
+            ) as wl_response:
+                if wl_response.status == 200:
+                    waterlevel_ids = frozenset([
+                        wl_id
+                        async for wl_station in _iter_stations(wl_response)
+                        if (wl_id := wl_station.findtext("id"))
+                    ])
+                    waterlevel_ok = True
+                    _LOGGER.info("Found %d water level stations", len(waterlevel_ids))
+        except Exception as err:
+            _LOGGER.warning("Could not fetch water level stations: %s", err)
+
+        # Fetch all tide prediction stations
+        params = {
+            "type": "tidepredictions",  # All stations with tide predictions
+            "units": "metric",
+        }
+
+        async with session.get(NOAA_STATIONS_URL, params=params) as response:
+            if response.status != 200:
+                _LOGGER.error("Error fetching station list: %s", response.status)
+                return None
+
+            station_ids: list[str] = []
+            names: list[str] = []
+            states: list[str] = []
+            # Coordinates go straight into typed buffers for the distance pass
+            lats = array("d")
+            lons = array("d")
+            async for station in _iter_stations(response):
+                # XML elements, not attributes; collect the wanted ones in a single pass over the children
+                fields = {child.tag: child.text for child in station if child.tag in _STATION_FIELDS}
+                station_id = fields.get("id")
+                name = fields.get("name")
+                lat_text = fields.get("lat")
+                lon_text = fields.get("lng")
+
+                if station_id is None or name is None or lat_text is None or lon_text is None:
+                    continue
+
+                try:
+                    lat = float(lat_text)
+                    lon = float(lon_text)
+                except ValueError:
+                    continue
+
+                station_ids.append(station_id)
+                names.append(name)
+                states.append(fields.get("state") or "")
+                lats.append(lat)
+                lons.append(lon)
+
+        lat_arr = np.frombuffer(lats, dtype=np.float64)
+        catalog = {
+            "ids": station_ids,
+            "names": names,
+            "states": states,
+            "lats": lat_arr,
+            "lons": np.frombuffer(lons, dtype=np.float64),
+            # Station latitudes are fixed, so their haversine term is computed once per catalog
+            "cos_lats": np.cos(np.radians(lat_arr)),
+            "waterlevel_ids": waterlevel_ids,
+        }
+
+        # Only keep complete catalogs so a failed water level fetch is retried next time
+        if waterlevel_ok and station_ids:
+            _STATIONS_CACHE["ts"] = time.monotonic()
+            _STATIONS_CACHE["data"] = catalog
+
+        return catalog
 
     async def get_all_predictions(
         self,
@@ -181,31 +331,21 @@ class NOAATidesAPI:
             params_hourly = None
             if supports_hourly:
                 params_hourly = {
+                    **self._base_params,
                     "product": "predictions",
-                    "application": "homeassistant",
                     "begin_date": now.strftime("%Y%m%d %H:%M"),
                     "end_date": (now + timedelta(hours=hours_after)).strftime("%Y%m%d %H:%M"),
-                    "datum": "MLLW",
-                    "station": self.station_id,
-                    "time_zone": "gmt",
-                    "units": "metric",
                     "interval": "h",  # Hourly data
-                    "format": "json",
                 }
 
             # Fetch historical water level observations if requested and supported
             params_historical = None
             if hours_before > 0 and supports_observations:
                 params_historical = {
+                    **self._base_params,
                     "product": "water_level",
-                    "application": "homeassistant",
                     "begin_date": (now - timedelta(hours=hours_before)).strftime("%Y%m%d %H:%M"),
                     "end_date": now.strftime("%Y%m%d %H:%M"),
-                    "datum": "MLLW",
-                    "station": self.station_id,
-                    "time_zone": "gmt",
-                    "units": "metric",
-                    "format": "json",
                 }
 
             # Fetch high/low predictions - broader range for interpolation
@@ -213,45 +353,26 @@ class NOAATidesAPI:
             # Add 12 hour buffer to ensure we have bracketing tides
             hilo_hours_before = max(12, hours_before + 12)
             params_hilo = {
+                **self._base_params,
                 "product": "predictions",
-                "application": "homeassistant",
                 "begin_date": (now - timedelta(hours=hilo_hours_before)).strftime("%Y%m%d %H:%M"),
                 "end_date": (now + timedelta(hours=hours_after)).strftime("%Y%m%d %H:%M"),
-                "datum": "MLLW",
-                "station": self.station_id,
-                "time_zone": "gmt",
-                "units": "metric",
                 "interval": "hilo",
-                "format": "json",
             }
 
-            # Fetch all data with proper context managers
-            async with self.session.get(NOAA_API_BASE, params=params_hilo) as hilo_response:
-                hilo_data = await hilo_response.json() if hilo_response.status == 200 else None
-
-            hourly_data = None
-            if params_hourly:
-                async with self.session.get(NOAA_API_BASE, params=params_hourly) as hourly_response:
-                    hourly_data = await hourly_response.json() if hourly_response.status == 200 else None
-
-            historical_data_raw = None
-            if params_historical:
-                async with self.session.get(NOAA_API_BASE, params=params_historical) as historical_response:
-                    historical_data_raw = await historical_response.json() if historical_response.status == 200 else None
+            # The requests are independent, so fetch them concurrently
+            hilo_data, hourly_data, historical_data_raw = await asyncio.gather(
+                self._fetch_json(params_hilo),
+                self._fetch_json(params_hourly),
+                self._fetch_json(params_historical),
+            )
 
             try:
                 # Process hourly data (future predictions)
                 hourly_predictions = None
+                hourly_times = hourly_heights = np.empty(0)
                 if hourly_data and "predictions" in hourly_data and hourly_data["predictions"]:
-                    hourly_predictions = []
-                    for pred in hourly_data["predictions"]:
-                        pred_time = datetime.strptime(pred["t"], "%Y-%m-%d %H:%M")
-                        pred_time = pred_time.replace(tzinfo=timezone.utc)
-                        pred_height = float(pred["v"])
-                        hourly_predictions.append({
-                            "time": pred_time,
-                            "height": pred_height,
-                        })
+                    hourly_times, hourly_heights, hourly_predictions = _parse_series(hourly_data["predictions"])
                     _LOGGER.debug("Station %s: Processed %d hourly predictions", self.station_id, len(hourly_predictions))
                 elif params_hourly:
                     _LOGGER.warning("Station %s: Hourly predictions requested but unavailable", self.station_id)
@@ -261,68 +382,52 @@ class NOAATidesAPI:
                 current_time = datetime.now(timezone.utc)
 
                 if hilo_data and "predictions" in hilo_data and hilo_data["predictions"]:
-                        for prediction in hilo_data["predictions"]:
-                            pred_time = datetime.strptime(prediction["t"], "%Y-%m-%d %H:%M")
-                            pred_time = pred_time.replace(tzinfo=timezone.utc)
-                            pred_type = prediction["type"]
-                            pred_height = float(prediction["v"])
-
-                            tide_data = {
-                                "time": pred_time,
-                                "height": pred_height,
-                                "type": pred_type,
-                            }
-                            all_tides.append(tide_data)
+                    all_tides = [
+                        {
+                            "time": _parse_noaa_ts(prediction["t"]),
+                            "height": float(prediction["v"]),
+                            "type": prediction["type"],
+                        }
+                        for prediction in hilo_data["predictions"]
+                    ]
+                    # NOAA returns tides in time order; sort once here (linear on ordered input)
+                    # so every consumer can rely on it and binary search instead of scanning
+                    all_tides.sort(key=itemgetter("time"))
 
                 # Find the two consecutive tides that bracket the current time
-                # These are used for interpolation
-                prev_tide = None
-                next_tide = None
-                for tide in all_tides:
-                    if tide["time"] <= current_time:
-                        prev_tide = tide
-                    elif tide["time"] > current_time and next_tide is None:
-                        next_tide = tide
-                        break
-
-                # For backward compatibility, also find next_high and next_low
-                # (for the sensors that display next high/low times)
+                # These are used for interpolation; tides are time-ordered so bisect the times
+                tide_times = [tide["time"] for tide in all_tides]
+                split = bisect_right(tide_times, current_time)
+                prev_tide = all_tides[split - 1] if split > 0 else None
+                next_tide = all_tides[split] if split < len(all_tides) else None
+
+                # For backward compatibility, also note next_high and next_low
+                # (for the sensors that display next high/low times): the first of each after now.
+                # These share the tide records rather than copying them
                 next_high = None
                 next_low = None
-                for tide in all_tides:
-                    if tide["time"] > current_time:
-                        if tide["type"] == TIDE_TYPE_HIGH and next_high is None:
-                            next_high = {
-                                "time": tide["time"],
-                                "height": tide["height"],
-                            }
-                        elif tide["type"] == TIDE_TYPE_LOW and next_low is None:
-                            next_low = {
-                                "time": tide["time"],
-                                "height": tide["height"],
-                            }
-                    if next_high and next_low:
+                for tide in all_tides[split:]:
+                    if tide["type"] == TIDE_TYPE_HIGH and next_high is None:
+                        next_high = tide
+                    elif tide["type"] == TIDE_TYPE_LOW and next_low is None:
+                        next_low = tide
+                    if next_high is not None and next_low is not None:
                         break
 
                 # Process historical water level observations
                 historical_data = []
+                historical_times = historical_heights = np.empty(0)
                 if historical_data_raw and "data" in historical_data_raw and historical_data_raw["data"]:
-                    for obs in historical_data_raw["data"]:
-                            obs_time = datetime.strptime(obs["t"], "%Y-%m-%d %H:%M")
-                            obs_time = obs_time.replace(tzinfo=timezone.utc)
-                            obs_height = float(obs["v"])
-                            historical_data.append({
-                                "time": obs_time,
-                                "height": obs_height,
-                            })
+                    historical_times, historical_heights, historical_data = _parse_series(historical_data_raw["data"])
                     _LOGGER.debug("Station %s: Fetched %d historical observations",
                                  self.station_id, len(historical_data))
                 elif params_historical:
                     _LOGGER.debug("Station %s: Historical data requested but unavailable", self.station_id)
 
                 # Merge historical and future predictions into a single timeline
-                # Both are already time-ordered, so concatenation preserves order
-                combined_predictions = historical_data + (hourly_predictions if hourly_predictions else [])
+                # Both are already time-ordered, so appending in place preserves order without a copy
+                combined_predictions = historical_data
+                combined_predictions.extend(hourly_predictions or ())
 
                 if next_high is None and next_low is None:
                     _LOGGER.error("No prediction data available")
@@ -335,7 +440,9 @@ class NOAATidesAPI:
                     "next_tide": next_tide,  # Next tide (for interpolation)
                     "all_tides": all_tides,  # All high/low tides for chart generation
                     "hourly_predictions": combined_predictions,  # Combined historical + future hourly data
-                    "historical_data": historical_data,  # Separate historical data
+                    # Same combined timeline as parallel arrays (epoch seconds, heights) for vectorized lookups
+                    "hourly_times": np.concatenate((historical_times, hourly_times)),
+                    "hourly_heights": np.concatenate((historical_heights, hourly_heights)),
                 }
             except Exception as e:
                 _LOGGER.error("Error processing prediction data: %s", e)
@@ -350,16 +457,12 @@ class NOAATidesAPI:
         try:
             now = datetime.now()
             params = {
+                **self._base_params,
                 "product": "predictions",
-                "application": "homeassistant",
                 "begin_date": now.strftime("%Y%m%d %H:%M"),
                 "end_date": (now + timedelta(days=1)).strftime("%Y%m%d %H:%M"),
-                "datum": "MLLW",
-                "station": self.station_id,
                 "time_zone": "lst_ldt",
-                "units": "metric",
                 "interval": "hilo",
-                "format": "json",
             }
 
             async with self.session.get(NOAA_API_BASE, params=params) as response:
@@ -380,58 +483,65 @@ class NOAATidesAPI:
         Returns:
             Dict with keys: supports_hourly, supports_observations
         """
-        capabilities = {
-            "supports_hourly": False,
-            "supports_observations": False,
-        }
-
         now = datetime.now(timezone.utc)
 
         # Test hourly predictions
-        try:
-            params_hourly = {
-                "product": "predictions",
-                "application": "homeassistant",
-                "begin_date": now.strftime("%Y%m%d %H:%M"),
-                "end_date": (now + timedelta(hours=6)).strftime("%Y%m%d %H:%M"),
-                "datum": "MLLW",
-                "station": self.station_id,
-                "time_zone": "gmt",
-                "units": "metric",
-                "interval": "h",
-                "format": "json",
-            }
-
-            async with self.session.get(NOAA_API_BASE, params=params_hourly, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if "predictions" in data and data["predictions"]:
-                        capabilities["supports_hourly"] = True
-                        _LOGGER.info("Station %s supports hourly predictions", self.station_id)
-        except Exception as err:
-            _LOGGER.debug("Station %s does not support hourly predictions: %s", self.station_id, err)
+        params_hourly = {
+            **self._base_params,
+            "product": "predictions",
+            "begin_date": now.strftime("%Y%m%d %H:%M"),
+            "end_date": (now + timedelta(hours=6)).strftime("%Y%m%d %H:%M"),
+            "interval": "h",
+        }
 
         # Test water level observations
-        try:
-            params_obs = {
-                "product": "water_level",
-                "application": "homeassistant",
-                "begin_date": (now - timedelta(hours=1)).strftime("%Y%m%d %H:%M"),
-                "end_date": now.strftime("%Y%m%d %H:%M"),
-                "datum": "MLLW",
-                "station": self.station_id,
-                "time_zone": "gmt",
-                "units": "metric",
-                "format": "json",
-            }
+        params_obs = {
+            **self._base_params,
+            "product": "water_level",
+            "begin_date": (now - timedelta(hours=1)).strftime("%Y%m%d %H:%M"),
+            "end_date": now.strftime("%Y%m%d %H:%M"),
+        }
+
+        # The probes are independent, so run them concurrently
+        supports_hourly, supports_observations = await asyncio.gather(
+            self._probe(params_hourly, "predictions"),
+            self._probe(params_obs, "data"),
+        )
 
-            async with self.session.get(NOAA_API_BASE, params=params_obs, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        if supports_hourly:
+            _LOGGER.info("Station %s supports hourly predictions", self.station_id)
+        if supports_observations:
+            _LOGGER.info("Station %s supports water level observations", self.station_id)
+
+        return {
+            "supports_hourly": supports_hourly,
+            "supports_observations": supports_observations,
+        }
+
+    async def _fetch_json(self, params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Fetch a datagetter response, returning None if skipped or unsuccessful."""
+        if params is None:
+            return None
+
+        async with self.session.get(NOAA_API_BASE, params=params) as response:
+            return json_loads(await response.read()) if response.status == 200 else None
+
+    async def _probe(self, params: dict[str, Any], key: str) -> bool:
+        """Check whether a datagetter request returns any records under key.
+
+        Only the start of the body is inspected: a supported product lists its first
+        record (with a "t" timestamp) right after the key, while unsupported ones
+        return an error object, so decoding the full JSON is unnecessary.
+        """
+        try:
+            async with self.session.get(NOAA_API_BASE, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    if "data" in data and data["data"]:
-                        capabilities["supports_observations"] = True
-                        _LOGGER.info("Station %s supports water level observations", self.station_id)
+                    try:
+                        prefix = await response.content.readexactly(PROBE_READ_BYTES)
+                    except asyncio.IncompleteReadError as err:
+                        prefix = err.partial  # Whole body was shorter than the probe size
+                    return f'"{key}"'.encode() in prefix and b'"t"' in prefix
         except Exception as err:
-            _LOGGER.debug("Station %s does not support observations: %s", self.station_id, err)
+            _LOGGER.debug("Station %s does not support %s: %s", self.station_id, params["product"], err)
 
-        return capabilities
+        return False
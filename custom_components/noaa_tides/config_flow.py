@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig, SelectSelectorMode
@@ -28,6 +28,21 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pattern: optional negative sign, number, followed by optional unit
+_DURATION_PATTERN = r"(-?(?:\d+\.?\d*|\.\d+))\s*([a-z]*)"
+_DURATION_RE = re.compile(rf"^{_DURATION_PATTERN}$")
+_DURATION_ITEM_RE = re.compile(_DURATION_PATTERN)
+# A comma-separated list of durations; empty entries are ignored
+_DURATION_LIST_RE = re.compile(rf"[\s,]*(?:{_DURATION_PATTERN}\s*(?:,[\s,]*|$))*")
+
+# Minutes per unit suffix; no suffix means minutes
+_UNIT_MINUTES: dict[str, float] = {
+    **dict.fromkeys(("", "m", "min", "mins", "minute", "minutes"), 1),
+    **dict.fromkeys(("h", "hr", "hrs", "hour", "hours"), 60),
+    **dict.fromkeys(("s", "sec", "secs", "second", "seconds"), 1 / 60),
+    **dict.fromkeys(("d", "day", "days"), 1440),
+}
+
 
 def parse_duration_to_minutes(duration_str: str) -> int | None:
     """Parse a duration string to minutes.
@@ -40,55 +55,39 @@ def parse_duration_to_minutes(duration_str: str) -> int | None:
     - "1.5h" -> 90 minutes
     - "30s" or "30sec" -> 0.5 minutes
     """
-    duration_str = duration_str.strip().lower()
-
-    # Try to parse as timedelta using HA's parser
-    try:
-        # Parse using Home Assistant's duration parser
-        # Formats: "HH:MM:SS", "HH:MM", seconds as int/float, or with unit suffixes
-        import re
-
-        # Check for common patterns (including negative values for historical)
-        # Pattern: optional negative sign, number, followed by optional unit
-        match = re.match(r'^(-?[\d.]+)\s*([a-z]*)$', duration_str)
-        if not match:
-            return None
+    match = _DURATION_RE.match(duration_str.strip().lower())
+    if not match:
+        return None
 
-        value_str, unit = match.groups()
-        try:
-            value = float(value_str)
-        except ValueError:
-            return None
+    # The pattern only admits well-formed numbers, so float() cannot fail here
+    value_str, unit = match.groups()
+    factor = _UNIT_MINUTES.get(unit)
+    if factor is None:
+        return None
 
-        # Convert to minutes based on unit
-        minutes = None
-        if not unit or unit in ('m', 'min', 'mins', 'minute', 'minutes'):
-            minutes = value
-        elif unit in ('h', 'hr', 'hrs', 'hour', 'hours'):
-            minutes = value * 60
-        elif unit in ('s', 'sec', 'secs', 'second', 'seconds'):
-            minutes = value / 60
-        elif unit in ('d', 'day', 'days'):
-            minutes = value * 1440
-        else:
-            return None
+    return int(float(value_str) * factor)
 
-        # For positive values, require at least 1 minute
-        # For negative values, allow any amount
-        if minutes is not None:
-            return int(minutes)
 
-        return None
+def parse_intervals_to_minutes(intervals_str: str) -> list[int] | None:
+    """Parse a comma-separated list of durations to minutes.
 
-    except Exception:
+    Returns None if any entry is malformed or rounds to zero minutes.
+    """
+    intervals_str = intervals_str.lower()
+    if not _DURATION_LIST_RE.fullmatch(intervals_str):
         return None
 
+    intervals = []
+    for value_str, unit in _DURATION_ITEM_RE.findall(intervals_str):
+        factor = _UNIT_MINUTES.get(unit)
+        if factor is None:
+            return None
+        minutes = int(float(value_str) * factor)
+        if minutes == 0:
+            return None
+        intervals.append(minutes)
 
-async def validate_station(hass: HomeAssistant, station_id: str) -> bool:
-    """Validate the station ID."""
-    session = async_get_clientsession(hass)
-    api = NOAATidesAPI(session, station_id)
-    return await api.verify_station()
+    return intervals
 
 
 class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -99,6 +98,7 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._stations: list[dict[str, Any]] = []
+        self._station_by_id: dict[str, dict[str, Any]] = {}
         self._zip_code: str | None = None
 
     async def async_step_user(
@@ -114,6 +114,7 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Try to find stations near this zip
             session = async_get_clientsession(self.hass)
             self._stations = await NOAATidesAPI.search_stations_by_zip(session, zip_code)
+            self._station_by_id = {station["id"]: station for station in self._stations}
 
             if not self._stations:
                 errors["base"] = "no_stations"
@@ -145,24 +146,22 @@ class NOAATidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             # Find the station details
             station_name = None
-            for station in self._stations:
-                if station["id"] == station_id:
-                    distance = station["distance"]
-                    state_str = f", {station['state']}" if station['state'] else ""
-                    station_name = f"{station['name']}{state_str}"
-                    break
+            if station := self._station_by_id.get(station_id):
+                state_str = f", {station['state']}" if station['state'] else ""
+                station_name = f"{station['name']}{state_str}"
 
             if not station_name:
                 # Fallback if we can't find it
                 station_name = f"Station {station_id}"
 
             # Validate station ID and detect capabilities
-            if not await validate_station(self.hass, station_id):
+            # Both checks share one client on Home Assistant's pooled session,
+            # so the probes reuse the same keep-alive connection to NOAA
+            api = NOAATidesAPI(async_get_clientsession(self.hass), station_id)
+            if not await api.verify_station():
                 errors["base"] = "invalid_station"
             else:
                 # Detect station capabilities
-                session = async_get_clientsession(self.hass)
-                api = NOAATidesAPI(session, station_id)
                 capabilities = await api.detect_capabilities()
 
                 return self.async_create_entry(
@@ -215,21 +214,13 @@ class NOAATidesOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             # Parse the comma-separated intervals
             intervals_str = user_input.get("prediction_intervals", "")
-            intervals = []
-
-            if intervals_str.strip():
-                # Parse comma-separated duration values
-                interval_parts = [x.strip() for x in intervals_str.split(",") if x.strip()]
-
-                for part in interval_parts:
-                    minutes = parse_duration_to_minutes(part)
-                    if minutes is None or minutes == 0:
-                        return self.async_show_form(
-                            step_id="init",
-                            data_schema=self._get_options_schema(),
-                            errors={"prediction_intervals": "invalid_intervals"},
-                        )
-                    intervals.append(minutes)
+            intervals = parse_intervals_to_minutes(intervals_str)
+            if intervals is None:
+                return self.async_show_form(
+                    step_id="init",
+                    data_schema=self._get_options_schema(),
+                    errors={"prediction_intervals": "invalid_intervals"},
+                )
 
             # Parse chart hours
             chart_hours = user_input.get("chart_hours", DEFAULT_CHART_HOURS)
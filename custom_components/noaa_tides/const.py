@@ -16,6 +16,7 @@ DEFAULT_CHART_HISTORY_HOURS = 0  # No historical data by default
 
 # API endpoints
 NOAA_API_BASE = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
+NOAA_STATIONS_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.xml"
 
 # Update interval
 UPDATE_INTERVAL = 10  # minutes
@@ -27,4 +28,8 @@ TIDE_TYPE_LOW = "L"
 # Tide mathematics constants
 TIDE_SEMI_PERIOD_HOURS = 6.2  # Average time between high and low tide (~12.4h / 2)
 TREND_STEADY_THRESHOLD_METERS = 0.1  # Height change threshold for "steady" trend
-RATE_DERIVATIVE_DELTA_SECONDS = 300.0  # Time delta for numerical derivative (5 minutes)
+TREND_RATE_REFRESH_SECONDS = 300  # Minimum time between trend/rate recalculations in local updates
+
+# Chart constants
+CHART_SMOOTH_INTERVAL_MINUTES = 6  # Spacing of smoothed chart points for short charts
+CHART_MAX_POINTS = 680  # About one point per pixel of the default chart's plot area
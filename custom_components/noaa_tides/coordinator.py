@@ -3,16 +3,23 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any
+import math
+import time
+from typing import Any, NamedTuple
+
+import numpy as np
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import NOAATidesAPI
 from .const import (
+    CHART_MAX_POINTS,
+    CHART_SMOOTH_INTERVAL_MINUTES,
     CONF_CHART_HISTORY_HOURS,
     CONF_CHART_HOURS,
     CONF_PREDICTION_INTERVALS,
@@ -23,19 +30,36 @@ from .const import (
     DEFAULT_CHART_HOURS,
     DEFAULT_PREDICTION_INTERVALS,
     DOMAIN,
+    TREND_RATE_REFRESH_SECONDS,
     UPDATE_INTERVAL,
 )
 from .tide_math import (
-    calculate_tide_rate,
-    estimate_trend_from_predictions,
+    calculate_tide_rate_array,
+    estimate_trend_from_arrays,
     generate_synthetic_predictions,
     interpolate_from_high_low,
-    interpolate_tide_height,
+    interpolate_tide_height_array,
+    interpolate_tide_heights_array,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class CachedPredictions(NamedTuple):
+    """Prediction data from the last API refresh, reused by local updates and charting."""
+
+    next_high: dict[str, Any] | None
+    next_low: dict[str, Any] | None
+    all_tides: list[dict[str, Any]]
+    # All tides as parallel epoch-second/height arrays (time-ordered, like all_tides)
+    tide_times: np.ndarray
+    tide_heights: np.ndarray
+    hourly_predictions: list[dict[str, Any]] | None  # Actual hourly data (for interpolation)
+    hourly_times: np.ndarray
+    hourly_heights: np.ndarray
+    hours_after: int  # How many hours were fetched, for synthetic generation
+
+
 class NOAATidesCoordinator(DataUpdateCoordinator):
     """NOAA Tides data update coordinator."""
 
@@ -44,6 +68,15 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
         self.station_id = entry.data[CONF_STATION_ID]
         self.station_name = entry.data[CONF_STATION_NAME]
         self.entry = entry
+        self._load_options()
+        # Every entity of this station shares the same device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.station_id)},
+            name=self.station_name,
+            manufacturer="NOAA",
+            model="Tide Station",
+            configuration_url=f"https://tidesandcurrents.noaa.gov/stationhome.html?id={self.station_id}",
+        )
         self.api = NOAATidesAPI(
             async_get_clientsession(hass),
             self.station_id,
@@ -54,7 +87,14 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
             "supports_observations": True,
         })
         self.last_update_time: datetime | None = None
-        self._cached_predictions = None  # Cache API data
+        self._cached_predictions: CachedPredictions | None = None  # Cache API data
+        self._chart_cache: list[dict[str, Any]] | None = None
+        # Whether the last chart series is already dense enough to draw without smoothing
+        self.chart_predictions_dense = False
+        self._last_trend_rate_monotonic: float | None = None  # When trend/rate were last computed
+        self._chart_cache_key: tuple | None = None
+        self._interval_cache: dict[int, dict[str, Any]] = {}
+        self._interval_cache_key: tuple | None = None
         self._local_update_unsub = None
 
         super().__init__(
@@ -64,6 +104,9 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=UPDATE_INTERVAL),
         )
 
+        # Pick up option changes without re-reading entry.options on every update
+        entry.async_on_unload(entry.add_update_listener(self._async_options_updated))
+
         # Set up frequent local updates every minute
         self._local_update_unsub = async_track_time_interval(
             hass,
@@ -81,13 +124,13 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
         """Fetch data from API."""
         try:
             # Calculate how many hours of predictions we need based on configured intervals
-            intervals = self.get_prediction_intervals()
+            intervals = self.prediction_intervals
             max_future_minutes = max((i for i in intervals if i > 0), default=0)
             min_past_minutes = min((i for i in intervals if i < 0), default=0)
 
             # Get configured chart hours (for historical data)
-            chart_hours = self.entry.options.get(CONF_CHART_HOURS, DEFAULT_CHART_HOURS)
-            chart_history_hours = self.entry.options.get(CONF_CHART_HISTORY_HOURS, DEFAULT_CHART_HISTORY_HOURS)
+            chart_hours = self.chart_hours
+            chart_history_hours = self.chart_history_hours
 
             # Calculate hours needed: 12 hours buffer + max of requirements
             # - Historical: max of chart history hours or prediction interval requirements
@@ -120,6 +163,9 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
             prev_tide = all_predictions.get("prev_tide")
             next_tide = all_predictions.get("next_tide")
             all_tides = all_predictions.get("all_tides", [])
+            # Same hourly series as parallel epoch-second/height arrays for interpolation
+            hourly_times = all_predictions.get("hourly_times")
+            hourly_heights = all_predictions.get("hourly_heights")
 
             _LOGGER.info(
                 "Station %s: Got predictions - hourly data: %s points, next_high: %s, next_low: %s, bracketing tides: %s",
@@ -130,11 +176,14 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
                 (prev_tide is not None and next_tide is not None),
             )
 
+            # One timestamp for everything derived in this update
+            now = datetime.now(timezone.utc)
+
             # Interpolate current data from predictions
             # Try hourly predictions first if available (linear interpolation)
             current = None
             if hourly_predictions:
-                current = interpolate_tide_height(hourly_predictions)
+                current = interpolate_tide_height_array(hourly_times, hourly_heights, now)
                 if current:
                     _LOGGER.debug(
                         "Interpolated current height from hourly: %.2f meters at %s",
@@ -144,7 +193,7 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
 
             # Fall back to bracketing tide interpolation (sinusoidal between consecutive tides)
             if current is None and prev_tide and next_tide:
-                current = interpolate_from_high_low(prev_tide, next_tide)
+                current = interpolate_from_high_low(prev_tide, next_tide, now)
                 if current:
                     _LOGGER.info(
                         "Interpolated current height from bracketing tides (%s at %s to %s at %s): %.2f meters",
@@ -153,14 +202,20 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
                         current["height"],
                     )
 
+            # Format the timestamp once here rather than on every attribute read
+            if current:
+                current["time_iso"] = current["time"].isoformat()
+
             # Calculate tide rate (meters/hour)
             # Pass hourly predictions for more accurate cubic spline derivative
             tide_rate = None
             if hourly_predictions or (next_high and next_low):
-                tide_rate = calculate_tide_rate(
-                    predictions=hourly_predictions,
+                tide_rate = calculate_tide_rate_array(
+                    hourly_times,
+                    hourly_heights,
                     next_high=next_high,
                     next_low=next_low,
+                    target_time=now,
                 )
                 if tide_rate is not None:
                     _LOGGER.debug("Calculated tide rate: %.3f m/hr", tide_rate)
@@ -168,21 +223,30 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
             # Estimate trend from hourly predictions
             trend = None
             if hourly_predictions:
-                trend = estimate_trend_from_predictions(hourly_predictions)
+                trend = estimate_trend_from_arrays(hourly_times, hourly_heights, now)
                 if trend:
                     _LOGGER.debug("Estimated trend from predictions: %s", trend)
 
             # Cache the prediction data for local updates and charting
-            self._cached_predictions = {
-                "next_high": next_high,
-                "next_low": next_low,
-                "all_tides": all_tides,
-                "hourly_predictions": hourly_predictions,  # Actual hourly data (for interpolation)
-                "hours_after": hours_after,  # Store how many hours we fetched for synthetic generation
-            }
+            self._cached_predictions = CachedPredictions(
+                next_high=next_high,
+                next_low=next_low,
+                all_tides=all_tides,
+                tide_times=np.fromiter(
+                    (tide["time"].timestamp() for tide in all_tides), dtype=np.float64, count=len(all_tides)
+                ),
+                tide_heights=np.fromiter(
+                    (tide["height"] for tide in all_tides), dtype=np.float64, count=len(all_tides)
+                ),
+                hourly_predictions=hourly_predictions,
+                hourly_times=hourly_times,
+                hourly_heights=hourly_heights,
+                hours_after=hours_after,
+            )
 
             # Update the timestamp
-            self.last_update_time = datetime.now(timezone.utc)
+            self.last_update_time = now
+            self._last_trend_rate_monotonic = time.monotonic()
 
             return {
                 "current": current,  # May be interpolated for prediction-only stations
@@ -200,52 +264,64 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
 
     async def _async_local_update(self, now: datetime | None = None) -> None:
         """Update interpolated values without fetching from API."""
-        if not self._cached_predictions:
+        if self._cached_predictions is None:
             return  # No cached data yet
 
+        # Use the time the tracker fired with, so every value in this update agrees
+        current_time = now or datetime.now(timezone.utc)
+
         try:
-            next_high = self._cached_predictions.get("next_high")
-            next_low = self._cached_predictions.get("next_low")
-            hourly_predictions = self._cached_predictions.get("hourly_predictions")
-            all_tides = self._cached_predictions.get("all_tides", [])
+            next_high = self._cached_predictions.next_high
+            next_low = self._cached_predictions.next_low
+            hourly_predictions = self._cached_predictions.hourly_predictions
+            hourly_times = self._cached_predictions.hourly_times
+            hourly_heights = self._cached_predictions.hourly_heights
+            all_tides = self._cached_predictions.all_tides
 
             # Recalculate interpolated current height
             # Use actual hourly data if available (linear), otherwise bracketing tides (sinusoidal)
             current = None
             if hourly_predictions:
-                current = interpolate_tide_height(hourly_predictions)
+                current = interpolate_tide_height_array(hourly_times, hourly_heights, current_time)
 
             # Fall back to bracketing tide interpolation
             if current is None and all_tides:
-                current_time = datetime.now(timezone.utc)
-                prev_tide = None
-                next_tide = None
-                for tide in all_tides:
-                    if tide["time"] <= current_time:
-                        prev_tide = tide
-                    elif tide["time"] > current_time and next_tide is None:
-                        next_tide = tide
-                        break
-
+                prev_tide, next_tide = self._find_bracketing_tides(current_time)
                 if prev_tide and next_tide:
-                    current = interpolate_from_high_low(prev_tide, next_tide)
+                    current = interpolate_from_high_low(prev_tide, next_tide, current_time)
+
+            if current:
+                current["time_iso"] = current["time"].isoformat()
+
+            # Rate and trend change slowly, so between refreshes keep the last published values
+            if (
+                self.data
+                and self._last_trend_rate_monotonic is not None
+                and time.monotonic() - self._last_trend_rate_monotonic < TREND_RATE_REFRESH_SECONDS
+            ):
+                tide_rate = self.data.get("tide_rate")
+                trend = self.data.get("trend")
+            else:
+                # Recalculate tide rate with improved accuracy
+                tide_rate = None
+                if hourly_predictions or (next_high and next_low):
+                    tide_rate = calculate_tide_rate_array(
+                        hourly_times,
+                        hourly_heights,
+                        next_high=next_high,
+                        next_low=next_low,
+                        target_time=current_time,
+                    )
 
-            # Recalculate tide rate with improved accuracy
-            tide_rate = None
-            if hourly_predictions or (next_high and next_low):
-                tide_rate = calculate_tide_rate(
-                    predictions=hourly_predictions,
-                    next_high=next_high,
-                    next_low=next_low,
-                )
+                # Recalculate trend from actual hourly predictions only (not synthetic)
+                trend = None
+                if hourly_predictions:
+                    trend = estimate_trend_from_arrays(hourly_times, hourly_heights, current_time)
 
-            # Recalculate trend from actual hourly predictions only (not synthetic)
-            trend = None
-            if hourly_predictions:
-                trend = estimate_trend_from_predictions(hourly_predictions)
+                self._last_trend_rate_monotonic = time.monotonic()
 
             # Update the timestamp
-            self.last_update_time = datetime.now(timezone.utc)
+            self.last_update_time = current_time
 
             # Update coordinator data without triggering API fetch
             self.async_set_updated_data({
@@ -263,99 +339,154 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Error during local update: %s", err)
 
+    def _find_bracketing_tides(
+        self, target_time: datetime
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Find the last tide at or before target_time and the first tide after it."""
+        all_tides = self._cached_predictions.all_tides
+        # all_tides is time-ordered, so one binary search over its cached times finds the bracket
+        index = int(np.searchsorted(self._cached_predictions.tide_times, target_time.timestamp(), side="right"))
+        prev_tide = all_tides[index - 1] if index > 0 else None
+        next_tide = all_tides[index] if index < len(all_tides) else None
+        return prev_tide, next_tide
+
+    def _load_options(self) -> None:
+        """Snapshot the entry options read on every update."""
+        options = self.entry.options
+        self.prediction_intervals: list[int] = options.get(CONF_PREDICTION_INTERVALS, DEFAULT_PREDICTION_INTERVALS)
+        self.chart_hours: int = options.get(CONF_CHART_HOURS, DEFAULT_CHART_HOURS)
+        self.chart_history_hours: int = options.get(CONF_CHART_HISTORY_HOURS, DEFAULT_CHART_HISTORY_HOURS)
+
+    async def _async_options_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the options snapshot after the options flow saves new values."""
+        self._load_options()
+        # The chart range and intervals decide how much data is fetched, so refresh now
+        await self.async_request_refresh()
+
     def get_prediction_intervals(self) -> list[int]:
         """Get the configured prediction intervals."""
-        return self.entry.options.get(
-            CONF_PREDICTION_INTERVALS,
-            DEFAULT_PREDICTION_INTERVALS,
-        )
+        return self.prediction_intervals
 
     def get_chart_predictions(self) -> list[dict[str, Any]] | None:
         """Get predictions for charting (generates synthetic if needed)."""
-        if not self._cached_predictions:
+        if self._cached_predictions is None:
             return None
 
         # Get configured chart hours
-        chart_hours = self.entry.options.get(CONF_CHART_HOURS, DEFAULT_CHART_HOURS)
-        chart_history_hours = self.entry.options.get(CONF_CHART_HISTORY_HOURS, DEFAULT_CHART_HISTORY_HOURS)
+        chart_hours = self.chart_hours
+        chart_history_hours = self.chart_history_hours
+        now = datetime.now(timezone.utc)
 
-        hourly_predictions = self._cached_predictions.get("hourly_predictions")
+        # Repeat calls for the same data, chart range and minute reuse the previous result
+        cache_key = (self.last_update_time, chart_hours, chart_history_hours, now.replace(second=0, microsecond=0))
+        if cache_key != self._chart_cache_key:
+            self._chart_cache, self.chart_predictions_dense = self._build_chart_predictions(
+                now, chart_hours, chart_history_hours
+            )
+            self._chart_cache_key = cache_key
+
+        return self._chart_cache
+
+    def _build_chart_predictions(
+        self, now: datetime, chart_hours: int, chart_history_hours: int
+    ) -> tuple[list[dict[str, Any]] | None, bool]:
+        """Build the chart series for the given range around now.
+
+        Returns the series and whether it is already at chart density, so the
+        chart can skip re-smoothing it.
+        """
+        hourly_predictions = self._cached_predictions.hourly_predictions
 
         # If we have hourly data, filter it to the requested chart range
         if hourly_predictions:
-            now = datetime.now(timezone.utc)
             start_time = now - timedelta(hours=chart_history_hours)
             end_time = now + timedelta(hours=chart_hours)
 
             # Filter predictions to requested time range with small buffer
             # Use slightly wider range (30 minute buffer) to ensure we capture boundary points
             buffer = timedelta(minutes=30)
-            filtered_predictions = [
-                p for p in hourly_predictions
-                if (start_time - buffer) <= p["time"] <= (end_time + buffer)
-            ]
+            # The series is time-ordered, so binary search its epoch times for the slice bounds
+            hourly_times = self._cached_predictions.hourly_times
+            lo = int(np.searchsorted(hourly_times, (start_time - buffer).timestamp(), side="left"))
+            hi = int(np.searchsorted(hourly_times, (end_time + buffer).timestamp(), side="right"))
+            filtered_predictions = hourly_predictions[lo:hi]
 
             if filtered_predictions:
                 _LOGGER.debug("Filtered %d hourly predictions to %d for chart (%dh history + %dh future)",
                              len(hourly_predictions), len(filtered_predictions),
                              chart_history_hours, chart_hours)
-                return filtered_predictions
+                return filtered_predictions, False
 
             # If filtering resulted in no data, return all (edge case)
-            return hourly_predictions
+            return hourly_predictions, False
 
         # Otherwise, generate synthetic predictions from high/low tides for chart display
-        all_tides = self._cached_predictions.get("all_tides")
+        all_tides = self._cached_predictions.all_tides
 
         if all_tides:
-            # Generate synthetic from history to future
+            # Generate synthetic from history to future, directly at chart density
+            # (the closed-form curve is marked dense so it is never re-splined), with
+            # no more points than the chart has pixels
+            span_minutes = (chart_hours + chart_history_hours) * 60
             synthetic = generate_synthetic_predictions(
                 all_tides,
                 hours=chart_hours,
-                history_hours=chart_history_hours
+                history_hours=chart_history_hours,
+                now=now,
+                interval_minutes=max(CHART_SMOOTH_INTERVAL_MINUTES, math.ceil(span_minutes / CHART_MAX_POINTS)),
             )
             if synthetic:
                 _LOGGER.debug("Generated %d synthetic chart predictions (%dh history + %dh future) from %d tides",
                              len(synthetic), chart_history_hours, chart_hours, len(all_tides))
-            return synthetic
+            return synthetic, True
 
-        return None
+        return None, False
 
     def calculate_interval_predictions(self) -> dict[int, dict[str, Any]]:
         """Calculate tide predictions at configured intervals (future or historical)."""
-        intervals = self.get_prediction_intervals()
-        predictions = {}
+        if self._cached_predictions is None:
+            return {}
 
-        if not self._cached_predictions:
-            return predictions
+        now = datetime.now(timezone.utc)
 
-        hourly_predictions = self._cached_predictions.get("hourly_predictions")
-        all_tides = self._cached_predictions.get("all_tides", [])
+        # Every prediction sensor reads this on each state write; compute it once per data update and minute
+        cache_key = (self.last_update_time, now.replace(second=0, microsecond=0))
+        if cache_key != self._interval_cache_key:
+            self._interval_cache = self._build_interval_predictions(now)
+            self._interval_cache_key = cache_key
 
-        now = datetime.now(timezone.utc)
+        return self._interval_cache
+
+    def _build_interval_predictions(self, now: datetime) -> dict[int, dict[str, Any]]:
+        """Build the interval predictions relative to now."""
+        intervals = self.prediction_intervals
+        predictions = {}
 
-        for interval_minutes in intervals:
-            target_time = now + timedelta(minutes=interval_minutes)
+        hourly_predictions = self._cached_predictions.hourly_predictions
+        hourly_times = self._cached_predictions.hourly_times
+        hourly_heights = self._cached_predictions.hourly_heights
+        all_tides = self._cached_predictions.all_tides
 
-            # Try to interpolate from hourly predictions first (includes historical if available)
-            # Uses linear interpolation for accuracy
+        target_times = [now + timedelta(minutes=interval_minutes) for interval_minutes in intervals]
+
+        # Interpolate all intervals from hourly predictions at once (includes historical if available)
+        hourly_results = None
+        if hourly_predictions and target_times:
+            hourly_results = interpolate_tide_heights_array(
+                hourly_times,
+                hourly_heights,
+                np.array([target_time.timestamp() for target_time in target_times]),
+            )
+
+        for index, (interval_minutes, target_time) in enumerate(zip(intervals, target_times)):
             predicted_height = None
-            if hourly_predictions:
-                result = interpolate_tide_height(hourly_predictions, target_time)
-                if result:
-                    predicted_height = result["height"]
+            if hourly_results is not None:
+                predicted_height = float(hourly_results[index])
 
             # Fall back to bracketing tide interpolation
             # Find the two consecutive tides that bracket the target time
             if predicted_height is None and all_tides:
-                prev_tide = None
-                next_tide = None
-                for tide in all_tides:
-                    if tide["time"] <= target_time:
-                        prev_tide = tide
-                    elif tide["time"] > target_time and next_tide is None:
-                        next_tide = tide
-                        break
+                prev_tide, next_tide = self._find_bracketing_tides(target_time)
 
                 # Interpolate between the bracketing tides
                 if prev_tide and next_tide:
@@ -366,6 +497,7 @@ class NOAATidesCoordinator(DataUpdateCoordinator):
             if predicted_height is not None:
                 predictions[interval_minutes] = {
                     "time": target_time,
+                    "time_iso": target_time.isoformat(),
                     "height": predicted_height,
                 }
 
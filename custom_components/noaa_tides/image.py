@@ -1,16 +1,23 @@
 """Image platform for NOAA Tides integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+from typing import Any
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CHART_MAX_POINTS,
+    CHART_SMOOTH_INTERVAL_MINUTES,
+    DOMAIN,
+)
 from .coordinator import NOAATidesCoordinator
 from .svg_chart import generate_tide_chart_svg
 from .tide_math import generate_smooth_chart_predictions
@@ -42,37 +49,64 @@ class NOAATidesChartImage(CoordinatorEntity[NOAATidesCoordinator], ImageEntity):
         ImageEntity.__init__(self, coordinator.hass)
 
         self._attr_unique_id = f"noaa_tides_{coordinator.station_id}_chart"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.station_id)},
-            name=coordinator.station_name,
-            manufacturer="NOAA",
-            model="Tide Station",
-            configuration_url=f"https://tidesandcurrents.noaa.gov/stationhome.html?id={coordinator.station_id}",
-        )
+        self._attr_device_info = coordinator.device_info
         self._cached_image: bytes | None = None
+        # Coordinator update and chart range the cached image was rendered for
+        self._cached_key: tuple | None = None
+        self._render_lock = asyncio.Lock()
+        self._local_tz = self._get_local_tz()
+
+    async def async_added_to_hass(self) -> None:
+        """Track Home Assistant time zone changes once added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated)
+        )
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Refresh the cached time zone after a core config change."""
+        self._local_tz = self._get_local_tz()
+        # Force the next request to re-render with the new time zone
+        self._cached_key = None
+
+    def _get_local_tz(self) -> str | None:
+        """Return Home Assistant's configured time zone name."""
+        time_zone = self.coordinator.hass.config.time_zone
+        return str(time_zone) if time_zone else None
 
     async def async_image(self) -> bytes | None:
         """Return the image."""
+        # The chart only changes when the coordinator updates (API refresh or the
+        # per-minute local update) or the chart range options change, so reuse
+        # the last render until one of those does
+        if self._cached_image is not None and self._render_key() == self._cached_key:
+            return self._cached_image
+
+        # Concurrent requests wait for the render in flight and then reuse its result
+        async with self._render_lock:
+            key = self._render_key()
+            if self._cached_image is None or key != self._cached_key:
+                await self._async_render(key)
+            return self._cached_image
+
+    def _render_key(self) -> tuple:
+        """Return the inputs that determine the rendered chart."""
+        return (
+            self.coordinator.last_update_time,
+            self.coordinator.chart_hours,
+            self.coordinator.chart_history_hours,
+        )
+
+    async def _async_render(self, key: tuple) -> None:
+        """Render the chart for the current coordinator data into the cache."""
         try:
             # Get prediction data
             predictions = self.coordinator.get_chart_predictions()
+            already_dense = self.coordinator.chart_predictions_dense
             if not predictions:
                 _LOGGER.warning("No prediction data available for chart")
-                return self._cached_image
-
-            # Generate smooth, dense predictions for better chart quality
-            # Only smooth if predictions are hourly (not already dense from synthetic generation)
-            # Check if predictions are approximately hourly by looking at time intervals
-            if len(predictions) >= 2:
-                avg_interval = (predictions[-1]["time"] - predictions[0]["time"]).total_seconds() / len(predictions)
-                # If average interval > 30 minutes, apply smoothing (hourly data)
-                # Otherwise predictions are already dense (synthetic at hourly intervals)
-                if avg_interval > 1800:  # 30 minutes
-                    smooth_predictions = generate_smooth_chart_predictions(predictions, interval_minutes=6)
-                else:
-                    smooth_predictions = predictions
-            else:
-                smooth_predictions = predictions
+                return
 
             # Get next high/low from coordinator data
             next_high = None
@@ -84,25 +118,49 @@ class NOAATidesChartImage(CoordinatorEntity[NOAATidesCoordinator], ImageEntity):
 
             # Get all tides for marking on chart
             all_tides = None
-            if self.coordinator._cached_predictions:
-                all_tides = self.coordinator._cached_predictions.get("all_tides")
-
-            # Get Home Assistant's configured timezone
-            local_tz = str(self.hass.config.time_zone) if self.hass.config.time_zone else None
-
-            # Generate SVG chart with smooth predictions
-            svg_content = generate_tide_chart_svg(
-                smooth_predictions,
-                next_high,
-                next_low,
-                all_tides=all_tides,
-                local_tz=local_tz,
-            )
+            if self.coordinator._cached_predictions is not None:
+                all_tides = self.coordinator._cached_predictions.all_tides
 
-            # Convert SVG to bytes and cache it
-            self._cached_image = svg_content.encode("utf-8")
-            return self._cached_image
+            # Smoothing, SVG generation and encoding are CPU-bound, so run them off the event loop
+            self._cached_image = await self.hass.async_add_executor_job(
+                _render_chart, predictions, already_dense, next_high, next_low, all_tides, self._local_tz
+            )
+            self._cached_key = key
 
         except Exception as err:
             _LOGGER.error("Error generating tide chart: %s", err)
-            return self._cached_image
+
+
+def _render_chart(
+    predictions: list[dict[str, Any]],
+    already_dense: bool,
+    next_high: dict[str, Any] | None,
+    next_low: dict[str, Any] | None,
+    all_tides: list[dict[str, Any]] | None,
+    local_tz: str | None,
+) -> bytes:
+    """Smooth the chart series and render it to SVG bytes (runs in the executor)."""
+    # Generate smooth, dense predictions for better chart quality
+    # Only smooth sparse (hourly) data; series generated at chart density (synthetic
+    # curves) and 6-minute observations are already dense. Otherwise the sampling
+    # step at the end of the series decides: history, when present, comes first
+    # and may be dense while the future part is hourly
+    smooth_predictions = predictions
+    if not already_dense and len(predictions) >= 2:
+        stride = (predictions[-1]["time"] - predictions[-2]["time"]).total_seconds()
+        if stride > 1800:  # 30 minutes
+            # Widen the spacing on long charts so the curve has no more points than pixels
+            span_minutes = (predictions[-1]["time"] - predictions[0]["time"]).total_seconds() / 60
+            interval_minutes = max(CHART_SMOOTH_INTERVAL_MINUTES, math.ceil(span_minutes / CHART_MAX_POINTS))
+            smooth_predictions = generate_smooth_chart_predictions(predictions, interval_minutes=interval_minutes)
+
+    # Generate SVG chart with smooth predictions
+    svg_content = generate_tide_chart_svg(
+        smooth_predictions,
+        next_high,
+        next_low,
+        all_tides=all_tides,
+        local_tz=local_tz,
+    )
+
+    return svg_content.encode("utf-8")
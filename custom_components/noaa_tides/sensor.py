@@ -1,9 +1,12 @@
 """Sensor platform for NOAA Tides integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cache
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,8 +15,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfLength
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,6 +24,33 @@ from .coordinator import NOAATidesCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only attribute mappings, so property reads don't allocate fixed dicts
+_EMPTY_ATTRIBUTES: Final[Mapping[str, Any]] = MappingProxyType({})
+# Trend lookups indexed by rate sign + 1: falling, steady, rising
+_TREND_ATTRIBUTES: Final[tuple[Mapping[str, Any], ...]] = tuple(
+    MappingProxyType({"direction": direction}) for direction in ("falling", "steady", "rising")
+)
+_TREND_ICONS: Final = ("mdi:arrow-down", "mdi:minus", "mdi:arrow-up")
+_HEIGHT_UNIT: Final = UnitOfLength.METERS
+
+
+@cache
+def _format_interval(minutes: int) -> tuple[str, str, str]:
+    """Return the friendly time string, ID string and icon for a prediction interval."""
+    abs_minutes = abs(minutes)
+    if abs_minutes < 60:
+        time_str = f"{abs_minutes}min"
+    else:
+        unit_minutes, unit = (60, "h") if abs_minutes < 1440 else (1440, "d")
+        whole, remainder = divmod(abs_minutes, unit_minutes)
+        time_str = f"{abs_minutes / unit_minutes:.1f}{unit}" if remainder else f"{whole}{unit}"
+
+    if minutes < 0:
+        # Historical prediction
+        return f"{time_str} ago", f"{abs_minutes}m_ago", "mdi:wave"
+    # Future prediction
+    return time_str, f"{abs_minutes}m", "mdi:waves-arrow-right"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,13 +83,15 @@ class NOAATidesBaseSensor(CoordinatorEntity[NOAATidesCoordinator], SensorEntity)
     def __init__(self, coordinator: NOAATidesCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.station_id)},
-            name=coordinator.station_name,
-            manufacturer="NOAA",
-            model="Tide Station",
-            configuration_url=f"https://tidesandcurrents.noaa.gov/stationhome.html?id={coordinator.station_id}",
-        )
+        self._attr_device_info = coordinator.device_info
+
+    def _prediction(self, key: str) -> dict[str, Any] | None:
+        """Return a tide event from the coordinator predictions, if available."""
+        data = self.coordinator.data
+        if not data:
+            return None
+        predictions = data.get("predictions")
+        return predictions.get(key) if predictions else None
 
 
 class NOAATidesCurrentHeightSensor(NOAATidesBaseSensor):
@@ -87,15 +118,15 @@ class NOAATidesCurrentHeightSensor(NOAATidesBaseSensor):
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         if self.coordinator.data and "current" in self.coordinator.data:
             current = self.coordinator.data["current"]
             if current is not None:
                 return {
-                    "last_updated": current["time"].isoformat(),
+                    "last_updated": current["time_iso"],
                 }
-        return {}
+        return _EMPTY_ATTRIBUTES
 
 
 class NOAATidesTrendSensor(NOAATidesBaseSensor):
@@ -110,41 +141,50 @@ class NOAATidesTrendSensor(NOAATidesBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"noaa_tides_{coordinator.station_id}_trend"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the rate of change in ft/hr."""
+        self._rate: float | None = None
+        self._trend_attributes = _EMPTY_ATTRIBUTES
+        self._trend_icon = "mdi:minus"
+        self._update_trend()
+
+    def _update_trend(self) -> None:
+        """Derive the rate, direction and icon from the latest coordinator data."""
+        rate = None
         if self.coordinator.data and "tide_rate" in self.coordinator.data:
             rate_m_per_hr = self.coordinator.data["tide_rate"]
             if rate_m_per_hr is not None:
                 # Convert meters/hour to feet/hour
-                return round(rate_m_per_hr * 3.28084, 2)
-        return None
+                rate = round(rate_m_per_hr * 3.28084, 2)
+
+        self._rate = rate
+        if rate is None:
+            self._trend_attributes = _EMPTY_ATTRIBUTES
+            self._trend_icon = "mdi:minus"
+        else:
+            # Beyond +/-0.1 ft/hr counts as rising/falling
+            sign = (rate > 0.1) - (rate < -0.1) + 1
+            self._trend_attributes = _TREND_ATTRIBUTES[sign]
+            self._trend_icon = _TREND_ICONS[sign]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the trend once per coordinator update."""
+        self._update_trend()
+        super()._handle_coordinator_update()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def native_value(self) -> float | None:
+        """Return the rate of change in ft/hr."""
+        return self._rate
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        rate = self.native_value
-        if rate is not None:
-            if rate > 0.1:
-                direction = "rising"
-            elif rate < -0.1:
-                direction = "falling"
-            else:
-                direction = "steady"
-            return {"direction": direction}
-        return {}
+        return self._trend_attributes
 
     @property
     def icon(self) -> str:
         """Return the icon based on trend."""
-        rate = self.native_value
-        if rate is not None:
-            if rate > 0.1:
-                return "mdi:arrow-up"
-            elif rate < -0.1:
-                return "mdi:arrow-down"
-        return "mdi:minus"
+        return self._trend_icon
 
 
 class NOAATidesNextHighSensor(NOAATidesBaseSensor):
@@ -162,23 +202,21 @@ class NOAATidesNextHighSensor(NOAATidesBaseSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the state of the sensor."""
-        if self.coordinator.data and "predictions" in self.coordinator.data:
-            predictions = self.coordinator.data["predictions"]
-            if predictions and predictions.get("next_high"):
-                return predictions["next_high"]["time"]
+        tide = self._prediction("next_high")
+        if tide:
+            return tide["time"]
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data and "predictions" in self.coordinator.data:
-            predictions = self.coordinator.data["predictions"]
-            if predictions and predictions.get("next_high"):
-                return {
-                    "height": predictions["next_high"]["height"],
-                    "unit": UnitOfLength.METERS,
-                }
-        return {}
+        tide = self._prediction("next_high")
+        if tide:
+            return {
+                "height": tide["height"],
+                "unit": _HEIGHT_UNIT,
+            }
+        return _EMPTY_ATTRIBUTES
 
 
 class NOAATidesNextLowSensor(NOAATidesBaseSensor):
@@ -196,23 +234,21 @@ class NOAATidesNextLowSensor(NOAATidesBaseSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return the state of the sensor."""
-        if self.coordinator.data and "predictions" in self.coordinator.data:
-            predictions = self.coordinator.data["predictions"]
-            if predictions and predictions.get("next_low"):
-                return predictions["next_low"]["time"]
+        tide = self._prediction("next_low")
+        if tide:
+            return tide["time"]
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
-        if self.coordinator.data and "predictions" in self.coordinator.data:
-            predictions = self.coordinator.data["predictions"]
-            if predictions and predictions.get("next_low"):
-                return {
-                    "height": predictions["next_low"]["height"],
-                    "unit": UnitOfLength.METERS,
-                }
-        return {}
+        tide = self._prediction("next_low")
+        if tide:
+            return {
+                "height": tide["height"],
+                "unit": _HEIGHT_UNIT,
+            }
+        return _EMPTY_ATTRIBUTES
 
 
 class NOAATidesPredictionSensor(NOAATidesBaseSensor):
@@ -233,37 +269,10 @@ class NOAATidesPredictionSensor(NOAATidesBaseSensor):
         self.interval_minutes = interval_minutes
 
         # Create a friendly name and ID based on the interval
-        if interval_minutes < 0:
-            # Historical prediction
-            abs_minutes = abs(interval_minutes)
-            if abs_minutes < 60:
-                time_str = f"{abs_minutes}min ago"
-                id_str = f"{abs_minutes}m_ago"
-            elif abs_minutes < 1440:
-                hours = abs_minutes / 60
-                time_str = f"{hours:.1f}h ago" if hours != int(hours) else f"{int(hours)}h ago"
-                id_str = f"{int(abs_minutes)}m_ago"
-            else:
-                days = abs_minutes / 1440
-                time_str = f"{days:.1f}d ago" if days != int(days) else f"{int(days)}d ago"
-                id_str = f"{int(abs_minutes)}m_ago"
-        else:
-            # Future prediction
-            if interval_minutes < 60:
-                time_str = f"{interval_minutes}min"
-                id_str = f"{interval_minutes}m"
-            elif interval_minutes < 1440:
-                hours = interval_minutes / 60
-                time_str = f"{hours:.1f}h" if hours != int(hours) else f"{int(hours)}h"
-                id_str = f"{interval_minutes}m"
-            else:
-                days = interval_minutes / 1440
-                time_str = f"{days:.1f}d" if days != int(days) else f"{int(days)}d"
-                id_str = f"{interval_minutes}m"
-
+        time_str, id_str, icon = _format_interval(interval_minutes)
         self._attr_name = f"Tide Height ({time_str})"
         self._attr_unique_id = f"noaa_tides_{coordinator.station_id}_prediction_{id_str}"
-        self._attr_icon = "mdi:wave" if interval_minutes < 0 else "mdi:waves-arrow-right"
+        self._attr_icon = icon
 
     @property
     def native_value(self) -> float | None:
@@ -274,13 +283,13 @@ class NOAATidesPredictionSensor(NOAATidesBaseSensor):
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional attributes."""
         predictions = self.coordinator.calculate_interval_predictions()
         if self.interval_minutes in predictions:
             pred = predictions[self.interval_minutes]
             return {
-                "prediction_time": pred["time"].isoformat(),
+                "prediction_time": pred["time_iso"],
                 "interval_minutes": self.interval_minutes,
             }
-        return {}
+        return _EMPTY_ATTRIBUTES
@@ -1,8 +1,58 @@
 """SVG tide chart generator."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+import time
 from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Meters to feet, the chart's display unit
+_M_TO_FT = 3.28084
+
+# Time-axis label steps (hours) and the chart spans past which the next step lands closer
+# to 8 labels: |span/a - 8| == |span/b - 8| at span = 16ab/(a+b)
+_LABEL_INTERVALS = (1, 2, 3, 4, 6, 12)
+_LABEL_INTERVAL_BREAKS = tuple(16 * a * b / (a + b) for a, b in zip(_LABEL_INTERVALS, _LABEL_INTERVALS[1:]))
+
+# Relative path segment templates, one decimal place per coordinate
+_CURVE_FORMAT = "c %.1f,%.1f %.1f,%.1f %.1f,%.1f"
+_LINE_FORMAT = "l %.1f,%.1f"
+
+# Pulls both fields of a prediction record in one call
+_time_and_height = itemgetter("time", "height")
+
+# Static stylesheet and gradient shared by every chart
+_DEFS_BLOCK = """\
+  <defs>
+    <style>
+      .chart-bg { fill: #1a1a1a; }
+      .grid-line { stroke: #444; stroke-width: 1; }
+      .axis-line { stroke: #666; stroke-width: 2; }
+      .tide-line { stroke: #4A90E2; stroke-width: 2; fill: none; }
+      .tide-fill { fill: url(#tide-gradient); opacity: 0.3; }
+      .text { fill: #ccc; font-family: Arial, sans-serif; font-size: 12px; }
+      .title { fill: #fff; font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }
+      .high-marker { stroke: #E24A4A; stroke-width: 2; stroke-dasharray: 5,5; }
+      .low-marker { stroke: #4AE2A8; stroke-width: 2; stroke-dasharray: 5,5; }
+      .marker-text { fill: #fff; font-size: 11px; font-weight: bold; }
+      .date-text { fill: #fff; font-size: 12px; font-weight: bold; }
+    </style>
+    <linearGradient id="tide-gradient" x1="0%" y1="0%" x2="0%" y2="100%">
+      <stop offset="0%" style="stop-color:#4A90E2;stop-opacity:0.5" />
+      <stop offset="100%" style="stop-color:#4A90E2;stop-opacity:0.1" />
+    </linearGradient>
+  </defs>"""
+
+
+@lru_cache(maxsize=32)
+def _get_zoneinfo(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA name, cached across renders."""
+    return ZoneInfo(name)
 
 
 def generate_tide_chart_svg(
@@ -43,66 +93,92 @@ def generate_tide_chart_svg(
     tz_info = None
     if local_tz:
         try:
-            from zoneinfo import ZoneInfo
-            tz_info = ZoneInfo(local_tz)
+            tz_info = _get_zoneinfo(local_tz)
         except Exception:
             pass  # Fall back to UTC if timezone invalid
 
-    # Extract data and convert meters to feet and times to local
+    # Extract data and convert meters to feet and times to local in a single pass
     times = []
-    for p in predictions:
-        t = p["time"]
+    heights = []
+    for t, h in map(_time_and_height, predictions):
         # Convert to local timezone if possible
         if tz_info and t.tzinfo:
             t = t.astimezone(tz_info)
         times.append(t)
-
-    heights = [p["height"] * 3.28084 for p in predictions]  # Convert m to ft
-
-    # Calculate scales
-    min_height = min(heights)
-    max_height = max(heights)
+        heights.append(h * _M_TO_FT)
+
+    # Chart edges and time range, bound once for the drawing code below
+    # Every x position is true elapsed (epoch) time from the start, so the chart
+    # stays consistent with itself across DST changes in the local zone
+    chart_right = width - padding
+    chart_bottom = height - padding
+    range_start = times[0]
+    range_end = times[-1]
+    start_seconds = range_start.timestamp()
+    end_seconds = range_end.timestamp()
+    span_seconds = end_seconds - start_seconds
+
+    # Calculate scales in one array pass each
+    height_array = np.asarray(heights)
+    min_height = float(height_array.min())
+    max_height = float(height_array.max())
     height_range = max_height - min_height
 
     if height_range == 0:
         height_range = 1  # Avoid division by zero
 
-    # Generate SVG path points
-    points = []
-    for i, (time, tide_height) in enumerate(zip(times, heights)):
-        x = padding + (i / (len(times) - 1)) * chart_width
-        # Invert y because SVG y-axis goes down
-        y = padding + chart_height - ((tide_height - min_height) / height_range) * chart_height
-        points.append((x, y))
+    # Generate SVG path points for the whole series at once
+    point_count = len(heights)
+    xs = padding + (np.arange(point_count) / (point_count - 1)) * chart_width
+    # Invert y because SVG y-axis goes down
+    ys = padding + chart_height - ((height_array - min_height) / height_range) * chart_height
+    # Path coordinates snapped to tenths of a pixel, kept as whole numbers of tenths
+    # so that the relative offsets below add up exactly without drift
+    x_tenths = np.rint(xs * 10)
+    y_tenths = np.rint(ys * 10)
+    start_x = x_tenths[0] / 10
 
     # Create smooth path data using cubic Bezier curves (Catmull-Rom spline)
-    path_data = f"M {points[0][0]},{points[0][1]}"
+    # Only the first point is absolute; every segment is relative to the previous end point
+    path_segments = [f"M {start_x:.1f},{y_tenths[0] / 10:.1f}"]
+
+    if point_count > 2:
+        # Neighbouring points of each segment p1 -> p2, clamped at the ends of the series
+        prev_index = np.concatenate(([0], np.arange(point_count - 2)))
+        next_index = np.concatenate((np.arange(2, point_count), [point_count - 1]))
+
+        # Catmull-Rom to Bezier conversion with tension 0.5 in matrix form:
+        # CP1 = P1 + (P2 - P0) / 12 = (-P0 + 12 P1 + P2) / 12, CP2 = (P1 + 12 P2 - P3) / 12
+        cp1_x = (12 * xs[:-1] + xs[1:] - xs[prev_index]) / 12
+        cp1_y = (12 * ys[:-1] + ys[1:] - ys[prev_index]) / 12
+        cp2_x = (12 * xs[1:] + xs[:-1] - xs[next_index]) / 12
+        cp2_y = (12 * ys[1:] + ys[:-1] - ys[next_index]) / 12
 
-    if len(points) > 2:
         # Use cubic Bezier curves for smooth transitions
-        for i in range(len(points) - 1):
-            # Calculate control points for smooth curve
-            p0 = points[max(0, i - 1)]
-            p1 = points[i]
-            p2 = points[i + 1]
-            p3 = points[min(len(points) - 1, i + 2)]
-
-            # Catmull-Rom to Bezier conversion with tension = 0.5
-            tension = 0.5
-            cp1_x = p1[0] + (p2[0] - p0[0]) / 6 * tension
-            cp1_y = p1[1] + (p2[1] - p0[1]) / 6 * tension
-            cp2_x = p2[0] - (p3[0] - p1[0]) / 6 * tension
-            cp2_y = p2[1] - (p3[1] - p1[1]) / 6 * tension
-
-            path_data += f" C {cp1_x},{cp1_y} {cp2_x},{cp2_y} {p2[0]},{p2[1]}"
+        segment_x = x_tenths[:-1]
+        segment_y = y_tenths[:-1]
+        offsets = np.column_stack((
+            np.rint(cp1_x * 10) - segment_x,
+            np.rint(cp1_y * 10) - segment_y,
+            np.rint(cp2_x * 10) - segment_x,
+            np.rint(cp2_y * 10) - segment_y,
+            x_tenths[1:] - segment_x,
+            y_tenths[1:] - segment_y,
+        )) / 10
     else:
         # Fallback to lines for very few points
-        for x, y in points[1:]:
-            path_data += f" L {x},{y}"
+        offsets = np.column_stack((np.diff(x_tenths), np.diff(y_tenths))) / 10
+
+    # Format every segment with one %-operation over a repeated template
+    if len(offsets):
+        segment_format = _CURVE_FORMAT if point_count > 2 else _LINE_FORMAT
+        path_segments.append(" ".join([segment_format] * len(offsets)) % tuple(offsets.ravel().tolist()))
+
+    path_data = " ".join(path_segments)
 
     # Start SVG
     # Calculate chart duration for title with smart humanization
-    time_span_hours = (times[-1] - times[0]).total_seconds() / 3600
+    time_span_hours = span_seconds / 3600
 
     if time_span_hours < 2:
         chart_title = "Tide Chart"
@@ -126,25 +202,7 @@ def generate_tide_chart_svg(
 
     svg_parts = [
         f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}">',
-        '  <defs>',
-        '    <style>',
-        '      .chart-bg { fill: #1a1a1a; }',
-        '      .grid-line { stroke: #444; stroke-width: 1; }',
-        '      .axis-line { stroke: #666; stroke-width: 2; }',
-        '      .tide-line { stroke: #4A90E2; stroke-width: 2; fill: none; }',
-        '      .tide-fill { fill: url(#tide-gradient); opacity: 0.3; }',
-        '      .text { fill: #ccc; font-family: Arial, sans-serif; font-size: 12px; }',
-        '      .title { fill: #fff; font-family: Arial, sans-serif; font-size: 16px; font-weight: bold; }',
-        '      .high-marker { stroke: #E24A4A; stroke-width: 2; stroke-dasharray: 5,5; }',
-        '      .low-marker { stroke: #4AE2A8; stroke-width: 2; stroke-dasharray: 5,5; }',
-        '      .marker-text { fill: #fff; font-size: 11px; font-weight: bold; }',
-        '      .date-text { fill: #fff; font-size: 12px; font-weight: bold; }',
-        '    </style>',
-        '    <linearGradient id="tide-gradient" x1="0%" y1="0%" x2="0%" y2="100%">',
-        '      <stop offset="0%" style="stop-color:#4A90E2;stop-opacity:0.5" />',
-        '      <stop offset="100%" style="stop-color:#4A90E2;stop-opacity:0.1" />',
-        '    </linearGradient>',
-        '  </defs>',
+        _DEFS_BLOCK,
         '',
         f'  <rect width="{width}" height="{height}" class="chart-bg"/>',
         '',
@@ -152,165 +210,188 @@ def generate_tide_chart_svg(
         '',
     ]
 
+    # Grid lines and axis labels are collected per style and emitted as <g> groups below
+    grid_lines = []
+    height_labels = []
+    time_labels = []
+    date_labels = []
+
     # Draw horizontal grid lines (5 lines)
     for i in range(6):
         y = padding + (i / 5) * chart_height
         grid_height = max_height - (i / 5) * height_range
-        svg_parts.append(f'  <line x1="{padding}" y1="{y}" x2="{width - padding}" y2="{y}" class="grid-line"/>')
-        svg_parts.append(f'  <text x="{padding - 10}" y="{y + 4}" text-anchor="end" class="text">{grid_height:.1f}</text>')
+        grid_lines.append(f'    <line x1="{padding}" y1="{y:.1f}" x2="{chart_right}" y2="{y:.1f}"/>')
+        height_labels.append(f'    <text x="{padding - 10}" y="{y + 4:.1f}">{grid_height:.1f}</text>')
 
     # Draw vertical grid lines and time labels at round hour intervals
-    time_span_hours = (times[-1] - times[0]).total_seconds() / 3600
-
-    # Choose interval to get ~8 labels: try 1, 2, 3, 4, 6, or 12 hours
-    target_labels = 8
-    possible_intervals = [1, 2, 3, 4, 6, 12]
-    interval_hours = min(possible_intervals, key=lambda h: abs(time_span_hours / h - target_labels))
+    # Choose interval to get ~8 labels: 1, 2, 3, 4, 6, or 12 hours (ties go to the shorter interval)
+    interval_hours = _LABEL_INTERVALS[bisect_left(_LABEL_INTERVAL_BREAKS, time_span_hours)]
 
     # Find the first round hour to start labeling
-    from datetime import timedelta
-    start_time = times[0]
     # Round up to next interval hour
-    hour_offset = (interval_hours - start_time.hour % interval_hours) % interval_hours
-    if hour_offset == 0 and start_time.minute > 0:
+    hour_offset = (interval_hours - range_start.hour % interval_hours) % interval_hours
+    if hour_offset == 0 and range_start.minute > 0:
         hour_offset = interval_hours
-    first_label_time = start_time.replace(minute=0, second=0, microsecond=0) + timedelta(hours=hour_offset)
 
-    # Check if chart spans multiple days
-    spans_multiple_days = (times[-1].date() != times[0].date())
-    last_date_labeled = None
-
-    # Generate labels at interval_hours apart
-    current_label_time = first_label_time
-    while current_label_time <= times[-1]:
-        if current_label_time >= times[0]:
+    # Step labels on the local wall clock so they stay on round multiples of
+    # interval_hours after a DST change, and place each one by its epoch time
+    label_tz = range_start.tzinfo
+    label_step = timedelta(hours=interval_hours)
+    label_wall = range_start.replace(minute=0, second=0, microsecond=0, tzinfo=None) + timedelta(hours=hour_offset)
+    drawn_labels = []
+    while True:
+        label_seconds = label_wall.replace(tzinfo=label_tz).timestamp()
+        if label_seconds > end_seconds:
+            break
+        current_label_time = datetime.fromtimestamp(label_seconds, label_tz)
+        # Wall-clock times skipped by a spring-forward change don't round-trip and get no label
+        if label_seconds >= start_seconds and current_label_time.replace(tzinfo=None) == label_wall:
             # Calculate x position based on time
-            time_fraction = (current_label_time - times[0]).total_seconds() / (times[-1] - times[0]).total_seconds()
+            time_fraction = (label_seconds - start_seconds) / span_seconds
             x = padding + time_fraction * chart_width
             time_label = current_label_time.strftime("%H:%M")
 
-            svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" class="grid-line"/>')
-            svg_parts.append(f'  <text x="{x}" y="{height - padding + 20}" text-anchor="middle" class="text">{time_label}</text>')
+            grid_lines.append(f'    <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}"/>')
+            time_labels.append(f'    <text x="{x:.1f}" y="{chart_bottom + 20}">{time_label}</text>')
+            drawn_labels.append((x, current_label_time))
+
+        label_wall += label_step
 
-            # Add date label if this is a new day and chart spans multiple days
+    # Date labels only apply when the chart spans multiple days, so single-day charts skip this pass
+    if range_end.date() != range_start.date():
+        last_date_labeled = None
+        for x, current_label_time in drawn_labels:
+            # Add date label if this is a new day
             # Only show if we've already labeled a different date (i.e., this is a transition)
             # OR if this is midnight (00:00) which marks a clear day boundary
-            if spans_multiple_days:
-                current_date = current_label_time.date()
-                is_midnight = current_label_time.hour == 0 and current_label_time.minute == 0
-                is_new_day = last_date_labeled is not None and current_date != last_date_labeled
-
-                if is_new_day or (is_midnight and last_date_labeled is None):
-                    date_label = current_label_time.strftime("%b %d")
-                    svg_parts.append(f'  <text x="{x}" y="{height - padding + 35}" text-anchor="middle" class="date-text">{date_label}</text>')
-                    last_date_labeled = current_date
-                elif last_date_labeled is None:
-                    # Track the first date without labeling it (unless it's midnight)
-                    last_date_labeled = current_date
-
-        current_label_time += timedelta(hours=interval_hours)
+            current_date = current_label_time.date()
+            is_midnight = current_label_time.hour == 0 and current_label_time.minute == 0
+            is_new_day = last_date_labeled is not None and current_date != last_date_labeled
+
+            if is_new_day or (is_midnight and last_date_labeled is None):
+                date_label = current_label_time.strftime("%b %d")
+                date_labels.append(f'    <text x="{x:.1f}" y="{chart_bottom + 35}">{date_label}</text>')
+                last_date_labeled = current_date
+            elif last_date_labeled is None:
+                # Track the first date without labeling it (unless it's midnight)
+                last_date_labeled = current_date
+
+    _append_group(svg_parts, 'class="grid-line"', grid_lines)
+    _append_group(svg_parts, 'class="text" text-anchor="end"', height_labels)
+    _append_group(svg_parts, 'class="text" text-anchor="middle"', time_labels)
+    _append_group(svg_parts, 'class="date-text" text-anchor="middle"', date_labels)
 
     # Draw axes
-    svg_parts.append(f'  <line x1="{padding}" y1="{padding}" x2="{padding}" y2="{height - padding}" class="axis-line"/>')
-    svg_parts.append(f'  <line x1="{padding}" y1="{height - padding}" x2="{width - padding}" y2="{height - padding}" class="axis-line"/>')
-
-    # Create filled area under the curve
-    fill_path = path_data + f" L {points[-1][0]},{height - padding} L {points[0][0]},{height - padding} Z"
-    svg_parts.append(f'  <path d="{fill_path}" class="tide-fill"/>')
-
-    # Draw the tide line
-    svg_parts.append(f'  <path d="{path_data}" class="tide-line"/>')
-
-    # Mark current time
-    now = datetime.now(timezone.utc)
-    if tz_info:
-        now = now.astimezone(tz_info)
-    if times[0] <= now <= times[-1]:
-        time_fraction = (now - times[0]).total_seconds() / (times[-1] - times[0]).total_seconds()
+    svg_parts.append(
+        f'  <line x1="{padding}" y1="{padding}" x2="{padding}" y2="{chart_bottom}" class="axis-line"/>\n'
+        f'  <line x1="{padding}" y1="{chart_bottom}" x2="{chart_right}" y2="{chart_bottom}" class="axis-line"/>'
+    )
+
+    # Create filled area under the curve, then draw the tide line on top
+    fill_path = path_data + f" V {chart_bottom} H {start_x:.1f} Z"
+    svg_parts.append(f'  <path d="{fill_path}" class="tide-fill"/>\n  <path d="{path_data}" class="tide-line"/>')
+
+    # Mark current time, compared as epoch seconds like every other x position
+    now_seconds = time.time()
+    if start_seconds <= now_seconds <= end_seconds:
+        time_fraction = (now_seconds - start_seconds) / span_seconds
         x = padding + time_fraction * chart_width
-        svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" stroke="#FFA500" stroke-width="2" stroke-dasharray="3,3"/>')
-        svg_parts.append(f'  <text x="{x + 5}" y="{padding + 30}" fill="#FFA500" font-size="11px" font-weight="bold">Now</text>')
+        svg_parts.append(
+            f'  <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}" stroke="#FFA500" stroke-width="2" stroke-dasharray="3,3"/>\n'
+            f'  <text x="{x + 5:.1f}" y="{padding + 30}" fill="#FFA500" font-size="11px" font-weight="bold">Now</text>'
+        )
 
     # Mark all high and low tides
     if all_tides:
-        # Track text label positions to avoid overlaps
+        # Track text label positions (kept sorted) to avoid overlaps
         high_label_positions = []
         low_label_positions = []
+        high_lines = []
+        low_lines = []
+        marker_labels = []
 
         for tide in all_tides:
-            if "time" not in tide or "height" not in tide or "type" not in tide:
+            tide_time = tide.get("time")
+            tide_height = tide.get("height")
+            tide_type = tide.get("type")
+            if tide_time is None or tide_height is None or tide_type is None:
                 continue
 
-            tide_time = tide["time"]
-            if tz_info and tide_time.tzinfo:
-                tide_time = tide_time.astimezone(tz_info)
-
-            # Only mark tides within the chart time range
-            if times[0] <= tide_time <= times[-1]:
-                time_fraction = (tide_time - times[0]).total_seconds() / (times[-1] - times[0]).total_seconds()
-                x = padding + time_fraction * chart_width
-                tide_ft = tide["height"] * 3.28084  # Convert m to ft
-
-                if tide["type"] == "H":
-                    # High tide marker
-                    svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" class="high-marker"/>')
+            # Only mark tides within the chart time range, placed by elapsed epoch seconds
+            # like the curve, labels and Now marker
+            offset_seconds = tide_time.timestamp() - start_seconds
+            if 0 <= offset_seconds <= span_seconds:
+                x = padding + offset_seconds / span_seconds * chart_width
+                tide_ft = tide_height * _M_TO_FT
 
+                if tide_type == "H":
                     # Smart label positioning to avoid overlap
-                    y_offset = 15
-                    for prev_x in high_label_positions:
-                        if abs(x - prev_x) < 50:  # Labels would overlap
-                            y_offset += 15
-                    high_label_positions.append(x)
-
-                    svg_parts.append(f'  <text x="{x + 5}" y="{padding + y_offset}" class="marker-text">H {tide_ft:.1f}</text>')
+                    y_offset = 15 + 15 * _count_within(high_label_positions, x, 50)
+                    insort(high_label_positions, x)
 
-                elif tide["type"] == "L":
-                    # Low tide marker
-                    svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" class="low-marker"/>')
+                    # High tide marker and its label
+                    high_lines.append(f'    <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}"/>')
+                    marker_labels.append(f'    <text x="{x + 5:.1f}" y="{padding + y_offset}">H {tide_ft:.1f}</text>')
 
+                elif tide_type == "L":
                     # Smart label positioning to avoid overlap
-                    y_offset = 5
-                    for prev_x in low_label_positions:
-                        if abs(x - prev_x) < 50:  # Labels would overlap
-                            y_offset += 15
-                    low_label_positions.append(x)
+                    y_offset = 5 + 15 * _count_within(low_label_positions, x, 50)
+                    insort(low_label_positions, x)
 
-                    svg_parts.append(f'  <text x="{x + 5}" y="{height - padding - y_offset}" class="marker-text">L {tide_ft:.1f}</text>')
+                    # Low tide marker and its label
+                    low_lines.append(f'    <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}"/>')
+                    marker_labels.append(f'    <text x="{x + 5:.1f}" y="{chart_bottom - y_offset}">L {tide_ft:.1f}</text>')
+
+        # Labels go last so they draw over every marker line
+        _append_group(svg_parts, 'class="high-marker"', high_lines)
+        _append_group(svg_parts, 'class="low-marker"', low_lines)
+        _append_group(svg_parts, 'class="marker-text"', marker_labels)
 
     # Fallback to next_high and next_low if all_tides not provided (backward compatibility)
     elif next_high or next_low:
         if next_high and "time" in next_high:
-            high_time = next_high["time"]
-            if tz_info and high_time.tzinfo:
-                high_time = high_time.astimezone(tz_info)
-            if times[0] <= high_time <= times[-1]:
-                time_fraction = (high_time - times[0]).total_seconds() / (times[-1] - times[0]).total_seconds()
-                x = padding + time_fraction * chart_width
-                high_ft = next_high["height"] * 3.28084
-                svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" class="high-marker"/>')
-                svg_parts.append(f'  <text x="{x + 5}" y="{padding + 15}" class="marker-text">High {high_ft:.1f}</text>')
+            offset_seconds = next_high["time"].timestamp() - start_seconds
+            if 0 <= offset_seconds <= span_seconds:
+                x = padding + offset_seconds / span_seconds * chart_width
+                high_ft = next_high["height"] * _M_TO_FT
+                svg_parts.append(
+                    f'  <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}" class="high-marker"/>\n'
+                    f'  <text x="{x + 5:.1f}" y="{padding + 15}" class="marker-text">High {high_ft:.1f}</text>'
+                )
 
         if next_low and "time" in next_low:
-            low_time = next_low["time"]
-            if tz_info and low_time.tzinfo:
-                low_time = low_time.astimezone(tz_info)
-            if times[0] <= low_time <= times[-1]:
-                time_fraction = (low_time - times[0]).total_seconds() / (times[-1] - times[0]).total_seconds()
-                x = padding + time_fraction * chart_width
-                low_ft = next_low["height"] * 3.28084
-                svg_parts.append(f'  <line x1="{x}" y1="{padding}" x2="{x}" y2="{height - padding}" class="low-marker"/>')
-                svg_parts.append(f'  <text x="{x + 5}" y="{height - padding - 5}" class="marker-text">Low {low_ft:.1f}</text>')
+            offset_seconds = next_low["time"].timestamp() - start_seconds
+            if 0 <= offset_seconds <= span_seconds:
+                x = padding + offset_seconds / span_seconds * chart_width
+                low_ft = next_low["height"] * _M_TO_FT
+                svg_parts.append(
+                    f'  <line x1="{x:.1f}" y1="{padding}" x2="{x:.1f}" y2="{chart_bottom}" class="low-marker"/>\n'
+                    f'  <text x="{x + 5:.1f}" y="{chart_bottom - 5}" class="marker-text">Low {low_ft:.1f}</text>'
+                )
 
     # Add axis labels
     time_label = "Time (Local)" if tz_info else "Time (UTC)"
-    svg_parts.append(f'  <text x="{width/2}" y="{height - 10}" text-anchor="middle" class="text">{time_label}</text>')
-    svg_parts.append(f'  <text x="20" y="{height/2}" text-anchor="middle" transform="rotate(-90 20 {height/2})" class="text">Height (ft)</text>')
+    svg_parts.append(
+        f'  <text x="{width/2}" y="{height - 10}" text-anchor="middle" class="text">{time_label}</text>\n'
+        f'  <text x="20" y="{height/2}" text-anchor="middle" transform="rotate(-90 20 {height/2})" class="text">Height (ft)</text>'
+    )
 
     svg_parts.append('</svg>')
 
     return '\n'.join(svg_parts)
 
 
+def _append_group(svg_parts: list[str], attributes: str, children: list[str]) -> None:
+    """Append children wrapped in a <g> that carries their shared attributes."""
+    if children:
+        svg_parts.append(f'  <g {attributes}>\n' + '\n'.join(children) + '\n  </g>')
+
+
+def _count_within(sorted_positions: list[float], x: float, distance: float) -> int:
+    """Count the positions strictly closer than distance to x."""
+    return bisect_left(sorted_positions, x + distance) - bisect_right(sorted_positions, x - distance)
+
+
 def _generate_empty_chart(width: int, height: int, message: str) -> str:
     """Generate an empty chart with a message."""
     return f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}">
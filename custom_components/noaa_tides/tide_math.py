@@ -4,12 +4,140 @@ from __future__ import annotations
 import logging
 import math
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
-from .const import TIDE_SEMI_PERIOD_HOURS, TREND_STEADY_THRESHOLD_METERS, RATE_DERIVATIVE_DELTA_SECONDS
+import numpy as np
+
+try:
+    from scipy.interpolate import CubicSpline
+    _HAS_SCIPY = True
+except ImportError:
+    # Without scipy the cubic paths fall back to linear/sinusoidal interpolation
+    CubicSpline = None
+    _HAS_SCIPY = False
+
+from .const import TIDE_SEMI_PERIOD_HOURS, TREND_STEADY_THRESHOLD_METERS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Estimated spacing between a high tide and the following low (or vice versa)
+_SEMI_PERIOD = timedelta(hours=TIDE_SEMI_PERIOD_HOURS)
+_SEMI_PERIOD_SECONDS = _SEMI_PERIOD.total_seconds()
+
+_UTC = timezone.utc
+_get_time = itemgetter("time")
+_get_height = itemgetter("height")
+
+
+def _ensure_utc(target_time: datetime | None) -> datetime:
+    """Return target_time, defaulting to now and treating naive times as UTC."""
+    if target_time is None:
+        return datetime.now(_UTC)
+    return target_time if target_time.tzinfo is not None else target_time.replace(tzinfo=_UTC)
+
+
+def _series_arrays(predictions: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray]:
+    """Return the epoch-second times and heights of a prediction list as float arrays."""
+    count = len(predictions)
+    # map() with itemgetter does the per-record lookups in C rather than a generator frame
+    times = np.fromiter(map(datetime.timestamp, map(_get_time, predictions)), float, count)
+    heights = np.fromiter(map(_get_height, predictions), float, count)
+    return times, heights
+
+
+@lru_cache(maxsize=8)
+def _build_spline(times_bytes: bytes, heights_bytes: bytes) -> tuple[float, Any] | None:
+    """Build the cubic spline for a series given as raw float64 buffers.
+
+    Returns the start timestamp and a spline over seconds since it, or None
+    when fewer than 4 unique points remain after deduplication.
+    """
+    times = np.frombuffer(times_bytes)
+    heights = np.frombuffer(heights_bytes)
+
+    # Remove duplicates (keep first occurrence)
+    steps = np.diff(times)
+    if (steps >= 0).all():
+        # Time-ordered (the normal case): duplicates are adjacent, so keep the first of each run
+        keep = np.concatenate(([True], steps > 0))
+        unique_times = times[keep]
+        unique_heights = heights[keep]
+    else:
+        # Out of order: sort while deduplicating
+        unique_times, first_index = np.unique(times, return_index=True)
+        unique_heights = heights[first_index]
+    if len(unique_times) < 4:
+        return None
+
+    # Seconds since the first point keep the spline well conditioned
+    start_ts = float(unique_times[0])
+    return start_ts, CubicSpline(unique_times - start_ts, unique_heights, bc_type="not-a-knot")
+
+
+def _get_spline(times: np.ndarray, heights: np.ndarray) -> tuple[float, Any] | None:
+    """Return the (cached) cubic spline for a series held as parallel arrays.
+
+    The series only changes when the coordinator refreshes, so keying on its
+    contents lets every sensor read and chart render in between reuse one spline.
+    """
+    return _build_spline(
+        np.ascontiguousarray(times, dtype=float).tobytes(),
+        np.ascontiguousarray(heights, dtype=float).tobytes(),
+    )
+
+
+def _predictions_at_offsets(
+    start_time: datetime, offsets: np.ndarray, heights: np.ndarray
+) -> list[dict[str, Any]]:
+    """Build prediction records at offsets (seconds) from start_time.
+
+    The offsets become timedeltas in one array conversion (rounded to the
+    microsecond), leaving a single datetime addition per point.
+    """
+    deltas = np.rint(offsets * 1e6).astype("timedelta64[us]").tolist()
+    return [{"time": start_time + delta, "height": height} for delta, height in zip(deltas, heights.tolist())]
+
+
+def _sinusoidal_interp(
+    elapsed: float | np.ndarray,
+    period: float | np.ndarray,
+    start_height: float | np.ndarray,
+    end_height: float | np.ndarray,
+) -> float | np.ndarray:
+    """Height on the half-cosine from start_height to end_height, elapsed into period.
+
+    Plain NumPy arithmetic, so it takes scalars or whole arrays of targets alike.
+    """
+    amplitude = (end_height - start_height) / 2
+    mean_height = (start_height + end_height) / 2
+    return mean_height - amplitude * np.cos(elapsed / period * np.pi)
+
+
+def _high_low_segment(
+    next_high: dict[str, Any],
+    next_low: dict[str, Any],
+    target_time: datetime,
+) -> tuple[float, float, float, float]:
+    """Return the half tide cycle covering target_time as (elapsed, period, start height, end height).
+
+    Between the two tides that is the cycle from the first to the second. Outside
+    them, the opposite tide is estimated one semi-period (~6.2 hours) before the
+    first or after the second.
+    """
+    # Order the two tides in time (low first when they coincide)
+    first, second = (next_high, next_low) if next_high["time"] < next_low["time"] else (next_low, next_high)
+
+    if target_time < first["time"]:
+        prev_time = first["time"] - _SEMI_PERIOD
+        return (target_time - prev_time).total_seconds(), _SEMI_PERIOD_SECONDS, second["height"], first["height"]
+    if target_time > second["time"]:
+        elapsed = (target_time - second["time"]).total_seconds()
+        return elapsed, _SEMI_PERIOD_SECONDS, second["height"], first["height"]
+    period = (second["time"] - first["time"]).total_seconds()
+    return (target_time - first["time"]).total_seconds(), period, first["height"], second["height"]
+
 
 def interpolate_tide_height(
     hourly_predictions: list[dict[str, Any]],
@@ -31,105 +159,41 @@ def interpolate_tide_height(
     if not hourly_predictions or len(hourly_predictions) < 2:
         return None
 
-    if target_time is None:
-        target_time = datetime.now(timezone.utc)
-
-    # Ensure target_time is timezone-aware
-    if target_time.tzinfo is None:
-        target_time = target_time.replace(tzinfo=timezone.utc)
+    target_time = _ensure_utc(target_time)
 
     # If we have enough points, try cubic interpolation
-    if len(hourly_predictions) >= 4:
+    if len(hourly_predictions) >= 4 and _HAS_SCIPY:
         try:
-            from scipy.interpolate import interp1d
-
-            # Extract times and heights
-            times = [p["time"] for p in hourly_predictions]
-            heights = [p["height"] for p in hourly_predictions]
-
             # Check if target_time is within range
-            if not (times[0] <= target_time <= times[-1]):
+            if not (hourly_predictions[0]["time"] <= target_time <= hourly_predictions[-1]["time"]):
                 # Outside range, use edge values
-                if target_time < times[0]:
-                    return {"height": heights[0], "time": target_time}
+                if target_time < hourly_predictions[0]["time"]:
+                    return {"height": hourly_predictions[0]["height"], "time": target_time}
                 else:
-                    return {"height": heights[-1], "time": target_time}
-
-            # Convert times to seconds since first prediction
-            start_time = times[0]
-            time_seconds = [(t - start_time).total_seconds() for t in times]
-            target_seconds = (target_time - start_time).total_seconds()
-
-            # Remove duplicates (keep first occurrence)
-            seen_times = set()
-            unique_times = []
-            unique_heights = []
-            for t, h in zip(time_seconds, heights):
-                if t not in seen_times:
-                    seen_times.add(t)
-                    unique_times.append(t)
-                    unique_heights.append(h)
+                    return {"height": hourly_predictions[-1]["height"], "time": target_time}
 
             # Need at least 4 unique points for cubic
-            if len(unique_times) < 4:
-                raise ValueError(f"Only {len(unique_times)} unique points after deduplication")
-
-            # Use piecewise cubic interpolation (more stable than global spline)
-            interp_func = interp1d(unique_times, unique_heights, kind='cubic', bounds_error=False, fill_value=(unique_heights[0], unique_heights[-1]))
+            cached = _get_spline(*_series_arrays(hourly_predictions))
+            if cached is None:
+                raise ValueError("Fewer than 4 unique points after deduplication")
+            start_ts, spline = cached
 
-            # Interpolate at target time
-            interpolated_height = float(interp_func(target_seconds))
+            # Interpolate at target time (clamped to the data, where the spline meets the edge heights)
+            target_seconds = target_time.timestamp() - start_ts
+            interpolated_height = float(spline(min(max(target_seconds, 0.0), spline.x[-1])))
 
             return {
                 "height": interpolated_height,
                 "time": target_time,
             }
 
-        except ImportError:
-            _LOGGER.debug("scipy not available, using linear interpolation")
         except Exception as err:
             _LOGGER.debug("Error in cubic interpolation: %s, falling back to linear", err)
 
-    # Fall back to linear interpolation
-    # Find the two predictions that bracket the target time
-    before = None
-    after = None
-
-    for i, pred in enumerate(hourly_predictions):
-        pred_time = pred["time"]
-
-        if pred_time <= target_time:
-            before = pred
-        elif pred_time > target_time and after is None:
-            after = pred
-            break
-
-    # If we can't bracket the time, use the closest point
-    if before is None:
-        # Target time is before all predictions
-        return {
-            "height": hourly_predictions[0]["height"],
-            "time": target_time,
-        }
-
-    if after is None:
-        # Target time is after all predictions
-        return {
-            "height": hourly_predictions[-1]["height"],
-            "time": target_time,
-        }
-
-    # Linear interpolation between hourly data points
-    time_span = (after["time"] - before["time"]).total_seconds()
-    time_offset = (target_time - before["time"]).total_seconds()
-
-    if time_span == 0:
-        ratio = 0
-    else:
-        ratio = time_offset / time_span
-
-    # Simple linear interpolation
-    interpolated_height = before["height"] + (after["height"] - before["height"]) * ratio
+    # Fall back to linear interpolation between the two predictions that bracket
+    # the target time, using the closest point's height outside the series
+    times, heights = _series_arrays(hourly_predictions)
+    interpolated_height = float(np.interp(target_time.timestamp(), times, heights))
 
     return {
         "height": interpolated_height,
@@ -137,6 +201,87 @@ def interpolate_tide_height(
     }
 
 
+def interpolate_tide_height_array(
+    times: np.ndarray,
+    heights: np.ndarray,
+    target_time: datetime | None = None,
+) -> dict[str, Any] | None:
+    """
+    Interpolate tide height from a series held as parallel arrays.
+
+    Same method as interpolate_tide_height (cubic when possible, linear for
+    fewer points), but reads epoch-second times directly so there is no
+    per-call record extraction and the bracket search is a binary search.
+
+    Args:
+        times: Time-ordered epoch seconds of the predictions or observations
+        heights: Heights matching times
+        target_time: Time to interpolate for (defaults to now)
+
+    Returns:
+        Dictionary with 'height' and 'time' keys, or None if unable to interpolate
+    """
+    target_time = _ensure_utc(target_time)
+
+    result = interpolate_tide_heights_array(times, heights, np.array([target_time.timestamp()]))
+    if result is None:
+        return None
+
+    return {
+        "height": float(result[0]),
+        "time": target_time,
+    }
+
+
+def interpolate_tide_heights_array(
+    times: np.ndarray,
+    heights: np.ndarray,
+    target_ts: np.ndarray,
+) -> np.ndarray | None:
+    """
+    Interpolate tide heights at many times from a series held as parallel arrays.
+
+    The interpolator is built once and evaluated for all targets in one call.
+    Uses cubic interpolation when possible, linear for fewer points, and edge
+    values outside the series.
+
+    Args:
+        times: Time-ordered epoch seconds of the predictions or observations
+        heights: Heights matching times
+        target_ts: Epoch seconds to interpolate at
+
+    Returns:
+        Array of heights matching target_ts, or None if unable to interpolate
+    """
+    if len(times) < 2:
+        return None
+
+    result = None
+
+    # If we have enough points, try cubic interpolation
+    if len(times) >= 4 and _HAS_SCIPY:
+        try:
+            # Need at least 4 unique points for cubic
+            cached = _get_spline(times, heights)
+            if cached is None:
+                raise ValueError("Fewer than 4 unique points after deduplication")
+            start_ts, spline = cached
+
+            # Targets outside the series are replaced with edge values below
+            result = spline(target_ts - start_ts)
+
+        except Exception as err:
+            _LOGGER.debug("Error in cubic interpolation: %s, falling back to linear", err)
+
+    if result is None:
+        # Fall back to linear interpolation between the two points bracketing each target
+        result = np.interp(target_ts, times, heights)
+
+    # Outside the series, use edge values
+    result = np.where(target_ts < times[0], heights[0], result)
+    return np.where(target_ts > times[-1], heights[-1], result)
+
+
 def interpolate_from_high_low(
     next_high: dict[str, Any] | None,
     next_low: dict[str, Any] | None,
@@ -159,75 +304,16 @@ def interpolate_from_high_low(
     if not next_high or not next_low:
         return None
 
-    if target_time is None:
-        target_time = datetime.now(timezone.utc)
-
-    # Ensure target_time is timezone-aware
-    if target_time.tzinfo is None:
-        target_time = target_time.replace(tzinfo=timezone.utc)
-
-    high_time = next_high["time"]
-    low_time = next_low["time"]
-    high_height = next_high["height"]
-    low_height = next_low["height"]
-
-    # Determine which comes first and setup the tide cycle
-    if high_time < low_time:
-        # High tide comes first, then low
-        first_time = high_time
-        first_height = high_height
-        second_time = low_time
-        second_height = low_height
-    else:
-        # Low tide comes first, then high
-        first_time = low_time
-        first_height = low_height
-        second_time = high_time
-        second_height = high_height
-
-    # If target time is before first tide, need to estimate backwards
-    if target_time < first_time:
-        # Estimate the previous opposite tide using semi-period
-        # Average tidal period is ~12.4 hours between same tides
-        # So opposite tide is ~6.2 hours before
-        time_before_first = timedelta(hours=TIDE_SEMI_PERIOD_HOURS)
-        prev_time = first_time - time_before_first
-        prev_height = second_height  # Opposite type
-
-        # Now interpolate between previous and first
-        period = (first_time - prev_time).total_seconds()
-        elapsed = (target_time - prev_time).total_seconds()
-    elif target_time > second_time:
-        # Estimate the next tide after second using semi-period
-        time_after_second = timedelta(hours=TIDE_SEMI_PERIOD_HOURS)
-        next_time = second_time + time_after_second
-        next_height = first_height  # Opposite type
-
-        # Now interpolate between second and next
-        period = (next_time - second_time).total_seconds()
-        elapsed = (target_time - second_time).total_seconds()
-        first_time = second_time
-        first_height = second_height
-        second_height = next_height
-    else:
-        # Target time is between the two tides (normal case)
-        period = (second_time - first_time).total_seconds()
-        elapsed = (target_time - first_time).total_seconds()
+    target_time = _ensure_utc(target_time)
+
+    elapsed, period, first_height, second_height = _high_low_segment(next_high, next_low, target_time)
 
     if period == 0:
         return {"height": first_height, "time": target_time}
 
-    # Sinusoidal interpolation (tides follow sine wave pattern)
-    # Height varies as: first_height + amplitude * cos(phase)
-    # where phase goes from 0 to π over the period
-    amplitude = (second_height - first_height) / 2
-    mean_height = (first_height + second_height) / 2
-
-    # Phase goes from 0 to π
-    phase = (elapsed / period) * math.pi
-
-    # Use cosine: starts at first height, goes to second height
-    interpolated_height = mean_height - amplitude * math.cos(phase)
+    # Sinusoidal interpolation (tides follow sine wave pattern), with the
+    # phase going from 0 to π over the period (first height to second height)
+    interpolated_height = float(_sinusoidal_interp(elapsed, period, first_height, second_height))
 
     return {
         "height": interpolated_height,
@@ -239,16 +325,22 @@ def generate_synthetic_predictions(
     all_tides: list[dict[str, Any]],
     hours: int = 24,
     history_hours: int = 0,
+    now: datetime | None = None,
+    interval_minutes: int = 60,
 ) -> list[dict[str, Any]] | None:
     """
-    Generate synthetic hourly predictions from all high/low tides.
+    Generate synthetic predictions from all high/low tides.
 
-    Uses piecewise sinusoidal interpolation between consecutive tides.
+    Uses piecewise sinusoidal interpolation between consecutive tides. The
+    curve is evaluated in closed form, so charts can ask for dense points
+    directly instead of smoothing an hourly series.
 
     Args:
         all_tides: List of all high/low tide predictions with 'time', 'height', and 'type' keys
         hours: Number of hours to generate into the future (default 24)
         history_hours: Number of hours to generate into the past (default 0)
+        now: Reference time the range is centered on (defaults to now)
+        interval_minutes: Minutes between generated points (default hourly)
 
     Returns:
         List of predictions with 'time' and 'height' keys, or None
@@ -256,58 +348,33 @@ def generate_synthetic_predictions(
     if not all_tides or len(all_tides) < 2:
         return None
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(_UTC)
     start_time = now - timedelta(hours=history_hours)
-    end_time = now + timedelta(hours=hours)
-    predictions = []
-
-    # Generate hourly predictions from past to future
-    # Need to include the final hour, so use range(total_hours + 1)
-    total_hours = history_hours + hours
-    for hour_offset in range(total_hours + 1):
-        target_time = start_time + timedelta(hours=hour_offset)
-
-        # Find the two tides that bracket this time
-        prev_tide = None
-        next_tide = None
-
-        for i, tide in enumerate(all_tides):
-            if tide["time"] <= target_time:
-                prev_tide = tide
-            if tide["time"] > target_time and next_tide is None:
-                next_tide = tide
-                break
-
-        # If we have both bracketing tides, interpolate
-        if prev_tide and next_tide:
-            period = (next_tide["time"] - prev_tide["time"]).total_seconds()
-            elapsed = (target_time - prev_tide["time"]).total_seconds()
-
-            if period > 0:
-                # Sinusoidal interpolation between the two tides
-                amplitude = (next_tide["height"] - prev_tide["height"]) / 2
-                mean_height = (prev_tide["height"] + next_tide["height"]) / 2
-                phase = (elapsed / period) * math.pi
-                height = mean_height - amplitude * math.cos(phase)
-
-                predictions.append({
-                    "time": target_time,
-                    "height": height,
-                })
-        elif prev_tide and not next_tide:
-            # Past the last known tide, use the last height
-            predictions.append({
-                "time": target_time,
-                "height": prev_tide["height"],
-            })
-        elif next_tide and not prev_tide:
-            # Before the first known tide, use the first height
-            predictions.append({
-                "time": target_time,
-                "height": next_tide["height"],
-            })
 
-    return predictions if predictions else None
+    # Evenly spaced targets from past to future, including both ends
+    total_seconds = (history_hours + hours) * 3600.0
+    num_points = int(total_seconds / (interval_minutes * 60)) + 1
+    target_offsets = np.linspace(0, total_seconds, num_points)
+    target_ts = start_time.timestamp() + target_offsets
+
+    # Find the two tides that bracket every target in one binary search
+    tide_ts, tide_heights = _series_arrays(all_tides)
+    next_index = np.searchsorted(tide_ts, target_ts, side="right")
+    index = np.clip(next_index, 1, len(tide_ts) - 1)
+    prev_ts = tide_ts[index - 1]
+    prev_heights = tide_heights[index - 1]
+    next_heights = tide_heights[index]
+
+    # Sinusoidal interpolation between the two tides
+    with np.errstate(divide="ignore", invalid="ignore"):
+        heights = _sinusoidal_interp(target_ts - prev_ts, tide_ts[index] - prev_ts, prev_heights, next_heights)
+
+    # Before the first known tide use the first height, past the last use the last height
+    heights = np.where(next_index == 0, tide_heights[0], heights)
+    heights = np.where(next_index == len(tide_ts), tide_heights[-1], heights)
+
+    return _predictions_at_offsets(start_time, target_offsets, heights)
 
 
 def calculate_tide_rate(
@@ -332,53 +399,50 @@ def calculate_tide_rate(
     Returns:
         Rate in meters/hour, or None if unable to calculate
     """
-    if target_time is None:
-        target_time = datetime.now(timezone.utc)
-
-    # Ensure target_time is timezone-aware
-    if target_time.tzinfo is None:
-        target_time = target_time.replace(tzinfo=timezone.utc)
+    times, heights = _series_arrays(predictions or [])
+    return calculate_tide_rate_array(times, heights, next_high, next_low, target_time)
 
-    # Try numerical derivative using cubic interpolation (most accurate)
-    if predictions and len(predictions) >= 4:
-        try:
-            from scipy.interpolate import interp1d
 
-            # Extract times and heights
-            times = [p["time"] for p in predictions]
-            heights = [p["height"] for p in predictions]
+def calculate_tide_rate_array(
+    times: np.ndarray,
+    heights: np.ndarray,
+    next_high: dict[str, Any] | None = None,
+    next_low: dict[str, Any] | None = None,
+    target_time: datetime | None = None,
+) -> float | None:
+    """
+    Calculate the rate of tide change in meters per hour from parallel arrays.
 
-            # Check if target_time is within range
-            if times[0] <= target_time <= times[-1]:
-                # Convert times to seconds since first prediction
-                start_time = times[0]
-                time_seconds = [(t - start_time).total_seconds() for t in times]
-                target_seconds = (target_time - start_time).total_seconds()
-
-                # Remove duplicates (keep first occurrence)
-                seen_times = set()
-                unique_times = []
-                unique_heights = []
-                for t, h in zip(time_seconds, heights):
-                    if t not in seen_times:
-                        seen_times.add(t)
-                        unique_times.append(t)
-                        unique_heights.append(h)
+    Same method as calculate_tide_rate, but reads epoch-second times directly
+    so the hourly series held by the coordinator needs no per-call extraction.
 
-                # Need at least 4 unique points for cubic
-                if len(unique_times) < 4:
-                    raise ValueError(f"Only {len(unique_times)} unique points after deduplication")
+    Args:
+        times: Time-ordered epoch seconds of the tide predictions (may be empty)
+        heights: Heights matching times
+        next_high: Next high tide with 'time' and 'height' keys (fallback)
+        next_low: Next low tide with 'time' and 'height' keys (fallback)
+        target_time: Time to calculate rate for (defaults to now)
 
-                # Use piecewise cubic interpolation
-                interp_func = interp1d(unique_times, unique_heights, kind='cubic', bounds_error=False, fill_value=(unique_heights[0], unique_heights[-1]))
+    Returns:
+        Rate in meters/hour, or None if unable to calculate
+    """
+    target_time = _ensure_utc(target_time)
 
-                # Calculate numerical derivative using small time delta
-                delta_t = RATE_DERIVATIVE_DELTA_SECONDS
-                h1 = float(interp_func(target_seconds - delta_t / 2))
-                h2 = float(interp_func(target_seconds + delta_t / 2))
+    # Try numerical derivative using cubic interpolation (most accurate)
+    if len(times) >= 4 and _HAS_SCIPY:
+        try:
+            # Check if target_time is within range
+            target_ts = target_time.timestamp()
+            if times[0] <= target_ts <= times[-1]:
+                # Need at least 4 unique points for cubic
+                cached = _get_spline(times, heights)
+                if cached is None:
+                    raise ValueError("Fewer than 4 unique points after deduplication")
+                start_ts, spline = cached
+                target_seconds = target_ts - start_ts
 
-                # Rate in meters per second
-                rate_per_second = (h2 - h1) / delta_t
+                # Rate in meters per second, from the spline's exact first derivative
+                rate_per_second = float(spline(target_seconds, 1))
 
                 # Convert to meters per hour
                 rate_per_hour = rate_per_second * 3600
@@ -386,8 +450,6 @@ def calculate_tide_rate(
                 _LOGGER.debug("Calculated tide rate using cubic interpolation: %.3f m/hr", rate_per_hour)
                 return rate_per_hour
 
-        except ImportError:
-            _LOGGER.debug("scipy not available for rate calculation, using sinusoidal")
         except Exception as err:
             _LOGGER.debug("Error in cubic interpolation rate calculation: %s, falling back", err)
 
@@ -395,40 +457,8 @@ def calculate_tide_rate(
     if not next_high or not next_low:
         return None
 
-    high_time = next_high["time"]
-    low_time = next_low["time"]
-    high_height = next_high["height"]
-    low_height = next_low["height"]
-
-    # Determine which comes first
-    if high_time < low_time:
-        first_time = high_time
-        first_height = high_height
-        second_time = low_time
-        second_height = low_height
-    else:
-        first_time = low_time
-        first_height = low_height
-        second_time = high_time
-        second_height = high_height
-
-    # Handle times outside the known tides
-    if target_time < first_time:
-        time_before_first = timedelta(hours=TIDE_SEMI_PERIOD_HOURS)
-        prev_time = first_time - time_before_first
-        period = (first_time - prev_time).total_seconds()
-        elapsed = (target_time - prev_time).total_seconds()
-        amplitude = (first_height - second_height) / 2
-    elif target_time > second_time:
-        time_after_second = timedelta(hours=TIDE_SEMI_PERIOD_HOURS)
-        next_time = second_time + time_after_second
-        period = (next_time - second_time).total_seconds()
-        elapsed = (target_time - second_time).total_seconds()
-        amplitude = (first_height - second_height) / 2
-    else:
-        period = (second_time - first_time).total_seconds()
-        elapsed = (target_time - first_time).total_seconds()
-        amplitude = (second_height - first_height) / 2
+    elapsed, period, first_height, second_height = _high_low_segment(next_high, next_low, target_time)
+    amplitude = (second_height - first_height) / 2
 
     if period == 0:
         return 0.0
@@ -460,38 +490,48 @@ def estimate_trend_from_predictions(
     if not hourly_predictions or len(hourly_predictions) < 3:
         return None
 
-    if target_time is None:
-        target_time = datetime.now(timezone.utc)
+    return estimate_trend_from_arrays(*_series_arrays(hourly_predictions), target_time)
 
-    # Ensure target_time is timezone-aware
-    if target_time.tzinfo is None:
-        target_time = target_time.replace(tzinfo=timezone.utc)
 
-    # Find predictions around target time
-    closest_idx = 0
-    min_diff = float('inf')
+def estimate_trend_from_arrays(
+    times: np.ndarray,
+    heights: np.ndarray,
+    target_time: datetime | None = None,
+) -> str | None:
+    """
+    Estimate tide trend (rising/falling/steady) from parallel arrays.
 
-    for i, pred in enumerate(hourly_predictions):
-        diff = abs((pred["time"] - target_time).total_seconds())
-        if diff < min_diff:
-            min_diff = diff
-            closest_idx = i
+    Args:
+        times: Time-ordered epoch seconds of the hourly tide predictions
+        heights: Heights matching times
+        target_time: Time to check trend for (defaults to now)
+
+    Returns:
+        "rising", "falling", "steady", or None
+    """
+    if len(times) < 3:
+        return None
+
+    target_time = _ensure_utc(target_time)
+
+    # Find the prediction closest to the target time (first one on ties)
+    closest_idx = int(np.argmin(np.abs(times - target_time.timestamp())))
 
     # Get surrounding predictions to determine trend
     if closest_idx == 0:
         # At the beginning, look forward
-        height_before = hourly_predictions[0]["height"]
-        height_after = hourly_predictions[1]["height"]
-    elif closest_idx == len(hourly_predictions) - 1:
+        height_before = heights[0]
+        height_after = heights[1]
+    elif closest_idx == len(heights) - 1:
         # At the end, look backward
-        height_before = hourly_predictions[-2]["height"]
-        height_after = hourly_predictions[-1]["height"]
+        height_before = heights[-2]
+        height_after = heights[-1]
     else:
         # In the middle, average the trend
-        height_before = hourly_predictions[closest_idx - 1]["height"]
-        height_after = hourly_predictions[closest_idx + 1]["height"]
+        height_before = heights[closest_idx - 1]
+        height_after = heights[closest_idx + 1]
 
-    height_diff = height_after - height_before
+    height_diff = float(height_after - height_before)
 
     # Threshold for "steady" trend
     if abs(height_diff) < TREND_STEADY_THRESHOLD_METERS:
@@ -525,61 +565,30 @@ def generate_smooth_chart_predictions(
         # Need at least 4 points for cubic interpolation, fall back to original
         return predictions
 
-    try:
-        from scipy.interpolate import interp1d
-        import numpy as np
-
-        # Extract times and heights
-        times = [p["time"] for p in predictions]
-        heights = [p["height"] for p in predictions]
-
-        # Convert times to seconds since first prediction
-        start_time = times[0]
-        time_seconds = [(t - start_time).total_seconds() for t in times]
-
-        # Remove duplicates (keep first occurrence)
-        seen_times = set()
-        unique_times = []
-        unique_heights = []
-        for t, h in zip(time_seconds, heights):
-            if t not in seen_times:
-                seen_times.add(t)
-                unique_times.append(t)
-                unique_heights.append(h)
-
-        if len(unique_times) < 4:
-            _LOGGER.warning("Not enough unique points after deduplication (%d), falling back", len(unique_times))
-            return predictions
-
-        time_seconds_array = np.array(unique_times)
-        heights_array = np.array(unique_heights)
+    if not _HAS_SCIPY:
+        _LOGGER.warning("scipy not available, falling back to original predictions")
+        return predictions
 
+    try:
         # Use cubic interpolation with not-a-knot boundary conditions
         # This prevents oscillations at the edges while maintaining smoothness
-        interp_func = interp1d(
-            time_seconds_array,
-            heights_array,
-            kind='cubic',
-            bounds_error=False,
-            fill_value=(heights_array[0], heights_array[-1])  # Use edge values outside range
-        )
+        cached = _get_spline(*_series_arrays(predictions))
+        if cached is None:
+            _LOGGER.warning("Not enough unique points after deduplication, falling back")
+            return predictions
+        _, spline = cached
+        start_time = predictions[0]["time"]
 
-        # Generate dense time points
-        total_duration = time_seconds_array[-1]
+        # Generate dense time points (all within the data range, so no extrapolation)
+        total_duration = spline.x[-1]
         num_points = int(total_duration / (interval_minutes * 60)) + 1
         dense_time_seconds = np.linspace(0, total_duration, num_points)
 
-        # Interpolate heights at dense time points
-        dense_heights = interp_func(dense_time_seconds)
+        # Evaluate the spline at every dense time point in one vectorized call
+        dense_heights = spline(dense_time_seconds)
 
-        # Convert back to datetime objects
-        dense_predictions = []
-        for t_sec, height in zip(dense_time_seconds, dense_heights):
-            time = start_time + timedelta(seconds=float(t_sec))
-            dense_predictions.append({
-                "time": time,
-                "height": float(height),
-            })
+        # Convert back to prediction records with datetime objects
+        dense_predictions = _predictions_at_offsets(start_time, dense_time_seconds, dense_heights)
 
         _LOGGER.debug(
             "Generated %d smooth predictions from %d original points using cubic interpolation",
@@ -588,9 +597,6 @@ def generate_smooth_chart_predictions(
 
         return dense_predictions
 
-    except ImportError:
-        _LOGGER.warning("scipy not available, falling back to original predictions")
-        return predictions
     except Exception as err:
         _LOGGER.error("Error generating smooth predictions: %s, falling back to original", err)
         return predictions
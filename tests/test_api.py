@@ -0,0 +1,39 @@
+"""Test NOAA Tides API helpers."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from custom_components.noaa_tides.api import _parse_noaa_ts, _parse_series, haversine_distance_vec
+
+
+def test_haversine_distance_vec():
+    """Test vectorized distance calculation against known distances."""
+    # Providence, RI -> The Battery, NY (~156 miles) and the point itself
+    lats = np.array([40.7006, 41.8071])
+    lons = np.array([-74.0142, -71.4012])
+
+    distances = haversine_distance_vec(41.8071, -71.4012, lats, lons)
+
+    assert distances.shape == (2,)
+    assert 150 < distances[0] < 160
+    assert distances[1] == 0
+
+
+def test_parse_noaa_ts():
+    """Test parsing of NOAA GMT timestamps."""
+    assert _parse_noaa_ts("2024-01-01 12:06") == datetime(2024, 1, 1, 12, 6, tzinfo=timezone.utc)
+
+
+def test_parse_series():
+    """Test batch parsing of a NOAA series into arrays and records."""
+    times, heights, series = _parse_series([
+        {"t": "2024-01-01 00:00", "v": "1.25"},
+        {"t": "2024-01-01 01:00", "v": "-0.5"},
+    ])
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert times.tolist() == [start.timestamp(), start.timestamp() + 3600]
+    assert heights.tolist() == [1.25, -0.5]
+    assert series[1] == {"time": datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc), "height": -0.5}
@@ -0,0 +1,52 @@
+"""Test NOAA Tides config flow helpers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.noaa_tides.config_flow import (
+    parse_duration_to_minutes,
+    parse_intervals_to_minutes,
+)
+
+
+@pytest.mark.parametrize(
+    ("duration", "minutes"),
+    [
+        ("15", 15),
+        ("-15min", -15),
+        ("1h", 60),
+        ("1.5h", 90),
+        (" 2 Hours ", 120),
+        ("1d", 1440),
+        (".5h", 30),
+    ],
+)
+def test_parse_duration_to_minutes(duration, minutes):
+    """Test parsing valid durations."""
+    assert parse_duration_to_minutes(duration) == minutes
+
+
+@pytest.mark.parametrize("duration", ["", "abc", "1x", "1.2.3h", ".", "--1h"])
+def test_parse_duration_to_minutes_invalid(duration):
+    """Test that malformed durations are rejected."""
+    assert parse_duration_to_minutes(duration) is None
+
+
+@pytest.mark.parametrize(
+    ("intervals", "minutes"),
+    [
+        ("", []),
+        ("15, 1h, -30min", [15, 60, -30]),
+        ("15,,1h,", [15, 60]),
+        ("15 min , 2 hours", [15, 120]),
+    ],
+)
+def test_parse_intervals_to_minutes(intervals, minutes):
+    """Test parsing comma-separated interval lists."""
+    assert parse_intervals_to_minutes(intervals) == minutes
+
+
+@pytest.mark.parametrize("intervals", ["1h 2h", "15, abc", "30s", "15, 1x"])
+def test_parse_intervals_to_minutes_invalid(intervals):
+    """Test that lists with malformed or zero entries are rejected."""
+    assert parse_intervals_to_minutes(intervals) is None
@@ -0,0 +1,23 @@
+"""Test NOAA Tides sensor helpers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.noaa_tides.sensor import _format_interval
+
+
+@pytest.mark.parametrize(
+    ("minutes", "expected"),
+    [
+        (30, ("30min", "30m", "mdi:waves-arrow-right")),
+        (-30, ("30min ago", "30m_ago", "mdi:wave")),
+        (60, ("1h", "60m", "mdi:waves-arrow-right")),
+        (90, ("1.5h", "90m", "mdi:waves-arrow-right")),
+        (-120, ("2h ago", "120m_ago", "mdi:wave")),
+        (1440, ("1d", "1440m", "mdi:waves-arrow-right")),
+        (-2160, ("1.5d ago", "2160m_ago", "mdi:wave")),
+    ],
+)
+def test_format_interval(minutes, expected):
+    """Test interval labels, IDs and icons."""
+    assert _format_interval(minutes) == expected
@@ -0,0 +1,47 @@
+"""Test SVG tide chart generation."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import re
+
+from custom_components.noaa_tides.svg_chart import generate_tide_chart_svg
+
+# 2025-03-08 12:00 EST, the day before the America/New_York spring-forward change
+DST_CHART_START = datetime(2025, 3, 8, 17, 0, tzinfo=timezone.utc)
+
+
+def _dst_predictions() -> list[dict]:
+    """Return a 39-hour hourly series crossing the spring-forward change."""
+    return [{"time": DST_CHART_START + timedelta(hours=i), "height": (i % 12) / 10} for i in range(40)]
+
+
+def test_chart_labels_across_dst():
+    """Test time labels stay on the local interval grid and the title uses elapsed time."""
+    svg = generate_tide_chart_svg(_dst_predictions(), local_tz="America/New_York")
+
+    assert "39-Hour Tide Chart" in svg
+    labels = re.findall(r'y="360">(\d\d:\d\d)</text>', svg)
+    assert labels == ["12:00", "18:00", "00:00", "06:00", "12:00", "18:00", "00:00"]
+
+    # Real elapsed time between the labels either side of the change is 5 hours, not 6
+    positions = [float(x) for x in re.findall(r'<text x="([\d.]+)" y="360">', svg)]
+    assert abs((positions[3] - positions[2]) - 5 / 39 * 680) < 0.2
+    assert abs((positions[4] - positions[3]) - 6 / 39 * 680) < 0.2
+
+
+def test_chart_markers_across_dst():
+    """Test tide markers line up with the curve point at the same time across a DST change."""
+    high_time = DST_CHART_START + timedelta(hours=30)
+    all_tides = [{"time": high_time, "height": 2.0, "type": "H"}]
+
+    svg = generate_tide_chart_svg(_dst_predictions(), all_tides=all_tides, local_tz="America/New_York")
+
+    # The 30th of 40 evenly spaced curve points
+    curve_x = 60 + 30 / 39 * 680
+    assert f'<line x1="{curve_x:.1f}" y1="60"' in svg.split('class="high-marker"')[1]
+
+    # The deprecated next_high fallback uses the same placement
+    svg = generate_tide_chart_svg(
+        _dst_predictions(), next_high={"time": high_time, "height": 2.0}, local_tz="America/New_York"
+    )
+    assert f'<line x1="{curve_x:.1f}" y1="60" x2="{curve_x:.1f}" y2="340" class="high-marker"/>' in svg
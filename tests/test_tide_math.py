@@ -3,10 +3,19 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
 from custom_components.noaa_tides.tide_math import (
+    _get_spline,
+    calculate_tide_rate,
+    calculate_tide_rate_array,
     interpolate_tide_height,
+    interpolate_tide_height_array,
+    interpolate_tide_heights_array,
     interpolate_from_high_low,
+    estimate_trend_from_arrays,
     estimate_trend_from_predictions,
+    generate_synthetic_predictions,
 )
 
 
@@ -24,6 +33,60 @@ def test_interpolate_tide_height_linear():
     assert abs(result["height"] - 1.5) < 0.01  # Should be halfway
 
 
+def test_interpolate_tide_height_array_matches_records():
+    """Test array interpolation against the record-based interpolator."""
+    start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    predictions = [
+        {"time": start + timedelta(hours=i), "height": h}
+        for i, h in enumerate([0.2, 1.1, 1.9, 1.4, 0.6, 0.1])
+    ]
+    times = np.array([p["time"].timestamp() for p in predictions])
+    heights = np.array([p["height"] for p in predictions])
+
+    for minutes in (-30, 0, 45, 150, 299, 330):
+        target_time = start + timedelta(minutes=minutes)
+        expected = interpolate_tide_height(predictions, target_time)
+        result = interpolate_tide_height_array(times, heights, target_time)
+        assert abs(result["height"] - expected["height"]) < 1e-9
+
+    # Fewer than 4 points uses linear interpolation
+    result = interpolate_tide_height_array(times[:2], heights[:2], start + timedelta(minutes=30))
+    assert abs(result["height"] - 0.65) < 1e-9
+
+
+def test_interpolate_tide_heights_array_batch():
+    """Test batch interpolation matches per-target interpolation."""
+    start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    times = np.array([(start + timedelta(hours=i)).timestamp() for i in range(6)])
+    heights = np.array([0.2, 1.1, 1.9, 1.4, 0.6, 0.1])
+    targets = [start + timedelta(minutes=m) for m in (-30, 20, 150, 330)]
+
+    result = interpolate_tide_heights_array(times, heights, np.array([t.timestamp() for t in targets]))
+
+    assert result is not None
+    for target_time, height in zip(targets, result):
+        assert abs(height - interpolate_tide_height_array(times, heights, target_time)["height"]) < 1e-9
+    assert result[0] == heights[0]
+    assert result[-1] == heights[-1]
+
+
+def test_spline_cached_by_contents():
+    """Test the spline is reused for an identical series and rebuilt when it changes."""
+    times = np.arange(6, dtype=float) * 3600 + 1_700_000_000
+    heights = np.array([0.2, 1.1, 1.9, 1.4, 0.6, 0.1])
+
+    start_ts, spline = _get_spline(times, heights)
+    assert start_ts == times[0]
+    assert _get_spline(times.copy(), heights.copy())[1] is spline
+
+    changed = heights.copy()
+    changed[2] = 2.0
+    assert _get_spline(times, changed)[1] is not spline
+
+    # Fewer than 4 unique points cannot be splined
+    assert _get_spline(np.repeat(times[:3], 2), np.repeat(heights[:3], 2)) is None
+
+
 def test_interpolate_from_high_low():
     """Test sinusoidal interpolation between high and low tide."""
     high_tide = {"time": datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc), "height": 2.0}
@@ -37,6 +100,74 @@ def test_interpolate_from_high_low():
     assert 0.5 < result["height"] < 1.5  # Should be near mean (1.0)
 
 
+def test_interpolate_from_high_low_outside_tides():
+    """Test the estimated half cycles before the first and after the second tide."""
+    high_tide = {"time": datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc), "height": 2.0}
+    low_tide = {"time": datetime(2024, 1, 1, 18, 0, tzinfo=timezone.utc), "height": 0.0}
+
+    # Approaching the first (high) tide from the estimated previous low
+    result = interpolate_from_high_low(high_tide, low_tide, datetime(2024, 1, 1, 11, 59, tzinfo=timezone.utc))
+    assert 1.9 < result["height"] <= 2.0
+    assert calculate_tide_rate(next_high=high_tide, next_low=low_tide, target_time=result["time"]) > 0
+
+    # Leaving the second (low) tide towards the estimated next high
+    result = interpolate_from_high_low(high_tide, low_tide, datetime(2024, 1, 1, 18, 1, tzinfo=timezone.utc))
+    assert 0.0 <= result["height"] < 0.1
+
+
+def test_generate_synthetic_predictions():
+    """Test hourly synthetic predictions between and beyond the known tides."""
+    start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    tides = [
+        {"time": start, "height": 0.0, "type": "L"},
+        {"time": start + timedelta(hours=6), "height": 2.0, "type": "H"},
+        {"time": start + timedelta(hours=12), "height": 0.5, "type": "L"},
+    ]
+
+    result = generate_synthetic_predictions(tides, hours=14, history_hours=2, now=start)
+
+    assert result is not None
+    assert [p["time"] for p in result] == [start + timedelta(hours=h) for h in range(-2, 15)]
+    heights = [p["height"] for p in result]
+    # Before the first tide and past the last, edge heights are held
+    assert heights[:3] == [0.0, 0.0, 0.0]
+    assert heights[-2:] == [0.5, 0.5]
+    # Halfway between low and high is the mean height
+    assert abs(heights[5] - 1.0) < 1e-9
+    assert abs(heights[8] - 2.0) < 1e-9
+
+    # Dense chart points follow the same curve
+    dense = generate_synthetic_predictions(tides, hours=14, history_hours=2, now=start, interval_minutes=6)
+    assert len(dense) == 161
+    assert dense[0]["time"] == result[0]["time"]
+    assert dense[-1]["time"] == result[-1]["time"]
+    for point, height in zip(dense[::10], heights):
+        assert abs(point["height"] - height) < 1e-9
+
+
+def test_rate_and_trend_arrays_match_records():
+    """Test the array rate and trend functions against the record-based ones."""
+    start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    predictions = [
+        {"time": start + timedelta(hours=i), "height": h}
+        for i, h in enumerate([0.2, 1.1, 1.9, 1.4, 0.6, 0.1])
+    ]
+    times = np.array([p["time"].timestamp() for p in predictions])
+    heights = np.array([p["height"] for p in predictions])
+
+    for minutes in (0, 45, 150, 299):
+        target_time = start + timedelta(minutes=minutes)
+        assert calculate_tide_rate_array(times, heights, target_time=target_time) == calculate_tide_rate(
+            predictions, target_time=target_time
+        )
+        assert estimate_trend_from_arrays(times, heights, target_time) == estimate_trend_from_predictions(
+            predictions, target_time
+        )
+
+    # Without a series the rate needs the high/low fallback
+    assert calculate_tide_rate_array(np.empty(0), np.empty(0), target_time=start) is None
+
+
 def test_estimate_trend_rising():
     """Test trend estimation for rising tide."""
     predictions = [